@@ -29,7 +29,7 @@ from .atm_operations import ATMOperations
 from .user_interface import display_welcome, display_menu, get_user_input
 from .validation import validate_account_number, validate_pin, validate_amount
 from .transaction_manager import add_transaction, get_mini_statement
-from .database import initialize_sample_data, get_account
+from .database import Account, initialize_sample_data, get_account
 
 # Define what gets imported with "from modules import *"
 __all__ = [
@@ -44,6 +44,7 @@ __all__ = [
     'validate_amount',
     'add_transaction',
     'get_mini_statement',
+    'Account',
     'initialize_sample_data',
     'get_account'
 ]
\ No newline at end of file
@@ -1,109 +1,153 @@
-"""
-Authentication Module for ATM Simulator
-Handles user login, PIN validation, and account locking functionality.
-"""
-
-from modules.validation import validate_account_number, validate_pin
-from modules.user_interface import get_user_input
-import time
-
-
-def authenticate_user(account, entered_pin):
-    """
-    Authenticate user by checking PIN.
-    
-    Args:
-        account (dict): User account data
-        entered_pin (str): PIN entered by user
-        
-    Returns:
-        bool: True if authentication successful, False otherwise
-    """
-    return account['pin'] == entered_pin and not account['locked']
-
-
-def handle_failed_attempt(account):
-    """
-    Handle failed login attempt by incrementing attempt counter.
-    
-    Args:
-        account (dict): User account data
-        
-    Returns:
-        bool: True if account should be locked, False otherwise
-    """
-    account['failed_attempts'] += 1
-    remaining_attempts = 3 - account['failed_attempts']
-    
-    if account['failed_attempts'] >= 3:
-        account['locked'] = True
-        return True
-    
-    print(f"\n❌ Incorrect PIN. You have {remaining_attempts} attempt(s) remaining.")
-    return False
-
-
-def reset_failed_attempts(account):
-    """
-    Reset failed attempts counter upon successful login.
-    
-    Args:
-        account (dict): User account data
-    """
-    account['failed_attempts'] = 0
-
-
-def login_user(accounts):
-    """
-    Handle complete user login process.
-    
-    Args:
-        accounts (dict): Dictionary of all user accounts
-        
-    Returns:
-        dict or None: User account data if successful, None if locked
-    """
-    print("\n" + "="*50)
-    print("           🏧 ATM LOGIN SYSTEM 🏧")
-    print("="*50)
-    
-    # Get and validate account number
-    while True:
-        account_number = get_user_input("Enter your account number: ").strip()
-        
-        if not validate_account_number(account_number):
-            continue
-            
-        if account_number not in accounts:
-            print("❌ Account not found. Please check your account number.")
-            continue
-            
-        break
-    
-    account = accounts[account_number]
-    
-    # Check if account is already locked
-    if account['locked']:
-        print("❌ This account is locked due to multiple failed attempts.")
-        print("Please contact bank support for assistance.")
-        return None
-    
-    print(f"\n👋 Hello, {account['name']}!")
-    
-    # PIN validation loop
-    while account['failed_attempts'] < 3:
-        pin = get_user_input("Enter your 4-digit PIN: ", mask=True)
-        
-        if not validate_pin(pin):
-            continue
-            
-        if authenticate_user(account, pin):
-            reset_failed_attempts(account)
-            print("✅ Login successful!")
-            time.sleep(1)
-            return account
-        else:
-            if handle_failed_attempt(account):
-                return None
-    
-    return None
\ No newline at end of file
+"""
+Authentication Module for ATM Simulator
+Handles user login, PIN validation, and account locking functionality.
+"""
+
+from collections import defaultdict
+from modules.validation import validate_account_number, validate_pin
+from modules.user_interface import get_user_input
+import hashlib
+import hmac
+import threading
+import time
+
+# One lock per account, created on first use. The lock lives outside the
+# account dict so it never has to be stripped before JSON serialization.
+_account_locks = defaultdict(threading.Lock)
+
+
+def get_account_lock(account_number):
+    """
+    Get the lock guarding an account's login state.
+
+    Args:
+        account_number (str): Account number the lock belongs to
+
+    Returns:
+        threading.Lock: Lock for that account
+    """
+    return _account_locks[account_number]
+
+
+def hash_pin(pin):
+    """
+    Hash a PIN for at-rest storage.
+
+    PINs are never kept in plaintext; accounts store the SHA-256 digest.
+    OpenSSL's sha256 dispatches to the SHA-NI instructions on modern x86,
+    so hashing a 4-digit PIN costs next to nothing per login.
+
+    Args:
+        pin (str): Plaintext PIN
+
+    Returns:
+        bytes: 32-byte SHA-256 digest of the PIN
+    """
+    return hashlib.sha256(pin.encode('utf-8')).digest()
+
+
+def authenticate_user(account, entered_pin):
+    """
+    Authenticate user by checking PIN.
+
+    Args:
+        account (Account): User account data
+        entered_pin (str): PIN entered by user
+
+    Returns:
+        bool: True if authentication successful, False otherwise
+    """
+    # compare_digest over the fixed 32-byte digests is constant-time, so
+    # the comparison leaks nothing about the stored PIN
+    return (not account.locked) and hmac.compare_digest(
+        account.pin_hash, hash_pin(entered_pin))
+
+
+def handle_failed_attempt(account):
+    """
+    Handle failed login attempt by incrementing attempt counter.
+    
+    Args:
+        account (Account): User account data
+        
+    Returns:
+        bool: True if account should be locked, False otherwise
+    """
+    account.failed_attempts += 1
+    remaining_attempts = 3 - account.failed_attempts
+    
+    if account.failed_attempts >= 3:
+        account.locked = True
+        return True
+    
+    print(f"\n❌ Incorrect PIN. You have {remaining_attempts} attempt(s) remaining.")
+    return False
+
+
+def reset_failed_attempts(account):
+    """
+    Reset failed attempts counter upon successful login.
+    
+    Args:
+        account (Account): User account data
+    """
+    account.failed_attempts = 0
+
+
+def login_user(accounts):
+    """
+    Handle complete user login process.
+    
+    Args:
+        accounts (dict): Dictionary of all user accounts
+        
+    Returns:
+        Account or None: User account data if successful, None if locked
+    """
+    print("\n" + "="*50)
+    print("           🏧 ATM LOGIN SYSTEM 🏧")
+    print("="*50)
+    
+    # Get and validate account number
+    while True:
+        account_number = get_user_input("Enter your account number: ").strip()
+
+        if not validate_account_number(account_number):
+            continue
+
+        # Single hash lookup: fetch and existence-check in one go
+        try:
+            account = accounts[account_number]
+            break
+        except KeyError:
+            print("❌ Account not found. Please check your account number.")
+            continue
+
+    # Hold the account's lock for the whole login session so concurrent
+    # sessions can't race on failed_attempts/locked
+    with get_account_lock(account_number):
+        # Check if account is already locked
+        if account.locked:
+            print("❌ This account is locked due to multiple failed attempts.")
+            print("Please contact bank support for assistance.")
+            return None
+
+        print(f"\n👋 Hello, {account.name}!")
+
+        # PIN validation loop
+        while account.failed_attempts < 3:
+            pin = get_user_input("Enter your 4-digit PIN: ", mask=True)
+
+            if not validate_pin(pin):
+                continue
+
+            if authenticate_user(account, pin):
+                reset_failed_attempts(account)
+                print("✅ Login successful!")
+                time.sleep(1)
+                return account
+            else:
+                if handle_failed_attempt(account):
+                    return None
+
+        return None
\ No newline at end of file
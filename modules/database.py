@@ -1,300 +1,493 @@
-"""
-Database Module
-Handles data storage and initialization for user accounts.
-Simulates a database with in-memory storage for the ATM system.
-"""
-
-from datetime import datetime, timedelta
-import json
-import os
-
-
-def initialize_sample_data():
-    """
-    Initialize sample account data for testing the ATM system.
-    
-    Returns:
-        dict: Dictionary containing sample user accounts
-    """
-    # Sample accounts with different scenarios
-    accounts = {
-        '123456789': {
-            'account_number': '123456789',
-            'name': 'John Smith',
-            'pin': '1234',
-            'balance': 1500.00,
-            'failed_attempts': 0,
-            'locked': False,
-            'transaction_history': [
-                {
-                    'date': datetime.now() - timedelta(days=5),
-                    'type': 'Deposit',
-                    'amount': 500.00,
-                    'balance_after': 1000.00
-                },
-                {
-                    'date': datetime.now() - timedelta(days=3),
-                    'type': 'Withdrawal',
-                    'amount': 200.00,
-                    'balance_after': 800.00
-                },
-                {
-                    'date': datetime.now() - timedelta(days=1),
-                    'type': 'Deposit',
-                    'amount': 700.00,
-                    'balance_after': 1500.00
-                }
-            ]
-        },
-        '987654321': {
-            'account_number': '987654321',
-            'name': 'Jane Doe',
-            'pin': '5678',
-            'balance': 2750.50,
-            'failed_attempts': 0,
-            'locked': False,
-            'transaction_history': [
-                {
-                    'date': datetime.now() - timedelta(days=7),
-                    'type': 'Deposit',
-                    'amount': 1000.00,
-                    'balance_after': 2000.00
-                },
-                {
-                    'date': datetime.now() - timedelta(days=4),
-                    'type': 'Withdrawal',
-                    'amount': 250.00,
-                    'balance_after': 1750.00
-                },
-                {
-                    'date': datetime.now() - timedelta(days=2),
-                    'type': 'Deposit',
-                    'amount': 1000.50,
-                    'balance_after': 2750.50
-                }
-            ]
-        },
-        '555666777': {
-            'account_number': '555666777',
-            'name': 'Bob Johnson',
-            'pin': '9999',
-            'balance': 50.00,
-            'failed_attempts': 0,
-            'locked': False,
-            'transaction_history': [
-                {
-                    'date': datetime.now() - timedelta(days=10),
-                    'type': 'Deposit',
-                    'amount': 100.00,
-                    'balance_after': 100.00
-                },
-                {
-                    'date': datetime.now() - timedelta(days=6),
-                    'type': 'Withdrawal',
-                    'amount': 50.00,
-                    'balance_after': 50.00
-                }
-            ]
-        },
-        '111222333': {
-            'account_number': '111222333',
-            'name': 'Alice Brown',
-            'pin': '0000',
-            'balance': 5000.00,
-            'failed_attempts': 2,  # Account with failed attempts
-            'locked': False,
-            'transaction_history': []
-        },
-        '444555666': {
-            'account_number': '444555666',
-            'name': 'Charlie Wilson',
-            'pin': '1111',
-            'balance': 750.25,
-            'failed_attempts': 3,
-            'locked': True,  # Locked account for testing
-            'transaction_history': []
-        }
-    }
-    
-    return accounts
-
-
-def save_account_data(accounts, filename='accounts.json'):
-    """
-    Save account data to a JSON file.
-    
-    Args:
-        accounts (dict): Dictionary of user accounts
-        filename (str): Name of the file to save to
-        
-    Returns:
-        bool: True if successful, False otherwise
-    """
-    try:
-        # Convert datetime objects to strings for JSON serialization
-        accounts_copy = {}
-        for acc_num, account in accounts.items():
-            accounts_copy[acc_num] = account.copy()
-            
-            if 'transaction_history' in accounts_copy[acc_num]:
-                for transaction in accounts_copy[acc_num]['transaction_history']:
-                    if isinstance(transaction['date'], datetime):
-                        transaction['date'] = transaction['date'].isoformat()
-        
-        with open(filename, 'w') as file:
-            json.dump(accounts_copy, file, indent=4)
-        
-        return True
-    
-    except Exception as e:
-        print(f"Error saving account data: {e}")
-        return False
-
-
-def load_account_data(filename='accounts.json'):
-    """
-    Load account data from a JSON file.
-    
-    Args:
-        filename (str): Name of the file to load from
-        
-    Returns:
-        dict: Dictionary of user accounts, or None if file doesn't exist
-    """
-    try:
-        if not os.path.exists(filename):
-            return None
-        
-        with open(filename, 'r') as file:
-            accounts = json.load(file)
-        
-        # Convert date strings back to datetime objects
-        for account in accounts.values():
-            if 'transaction_history' in account:
-                for transaction in account['transaction_history']:
-                    if isinstance(transaction['date'], str):
-                        transaction['date'] = datetime.fromisoformat(transaction['date'])
-        
-        return accounts
-    
-    except Exception as e:
-        print(f"Error loading account data: {e}")
-        return None
-
-
-def create_new_account(account_number, name, pin, initial_balance=0.00):
-    """
-    Create a new user account.
-    
-    Args:
-        account_number (str): Unique account number
-        name (str): Account holder's name
-        pin (str): 4-digit PIN
-        initial_balance (float): Starting balance
-        
-    Returns:
-        dict: New account data
-    """
-    return {
-        'account_number': account_number,
-        'name': name,
-        'pin': pin,
-        'balance': initial_balance,
-        'failed_attempts': 0,
-        'locked': False,
-        'transaction_history': []
-    }
-
-
-def get_account(accounts, account_number):
-    """
-    Retrieve account data by account number.
-    
-    Args:
-        accounts (dict): Dictionary of all accounts
-        account_number (str): Account number to search for
-        
-    Returns:
-        dict or None: Account data if found, None otherwise
-    """
-    return accounts.get(account_number)
-
-
-def account_exists(accounts, account_number):
-    """
-    Check if an account exists.
-    
-    Args:
-        accounts (dict): Dictionary of all accounts
-        account_number (str): Account number to check
-        
-    Returns:
-        bool: True if account exists, False otherwise
-    """
-    return account_number in accounts
-
-
-def update_account(accounts, account_number, updated_data):
-    """
-    Update account data.
-    
-    Args:
-        accounts (dict): Dictionary of all accounts
-        account_number (str): Account number to update
-        updated_data (dict): Updated account data
-        
-    Returns:
-        bool: True if successful, False if account not found
-    """
-    if account_number in accounts:
-        accounts[account_number].update(updated_data)
-        return True
-    return False
-
-
-def delete_account(accounts, account_number):
-    """
-    Delete an account (admin function).
-    
-    Args:
-        accounts (dict): Dictionary of all accounts
-        account_number (str): Account number to delete
-        
-    Returns:
-        bool: True if successful, False if account not found
-    """
-    if account_number in accounts:
-        del accounts[account_number]
-        return True
-    return False
-
-
-def get_all_accounts(accounts):
-    """
-    Get all account numbers and names (admin function).
-    
-    Args:
-        accounts (dict): Dictionary of all accounts
-        
-    Returns:
-        list: List of tuples (account_number, name)
-    """
-    return [(acc_num, acc['name']) for acc_num, acc in accounts.items()]
-
-
-def backup_accounts(accounts, backup_filename=None):
-    """
-    Create a backup of all account data.
-    
-    Args:
-        accounts (dict): Dictionary of all accounts
-        backup_filename (str): Optional backup filename
-        
-    Returns:
-        str or None: Backup filename if successful, None otherwise
-    """
-    if backup_filename is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_filename = f"accounts_backup_{timestamp}.json"
-    
+"""
+Database Module
+Handles data storage and initialization for user accounts.
+Simulates a database with in-memory storage for the ATM system.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+import json
+import os
+import pickle
+import sys
+import time
+
+from modules.authentication import hash_pin
+from modules.transaction_manager import HISTORY_LIMIT, NS_PER_DAY
+from modules.user_interface import format_currency
+
+# orjson serializes datetimes natively in C and is several times faster than
+# the stdlib json module; fall back to json when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@dataclass(slots=True)
+class Account:
+    """
+    A single user account.
+
+    Slots keep per-account memory low and make attribute access a fixed
+    offset lookup instead of a dict probe. Underscored fields are derived
+    display caches and are not persisted.
+    """
+    account_number: str
+    name: str
+    pin_hash: bytes
+    balance: float
+    failed_attempts: int = 0
+    locked: bool = False
+    transaction_history: deque = field(
+        default_factory=lambda: deque(maxlen=HISTORY_LIMIT))
+    _balance_str: str = ''
+    _mini_cache: list = None
+
+    def __post_init__(self):
+        if not self._balance_str:
+            self._balance_str = format_currency(self.balance)
+
+
+def _days_ago_ns(days):
+    """
+    Timestamp of `days` days ago as integer nanoseconds since the epoch.
+    """
+    return time.time_ns() - days * NS_PER_DAY
+
+
+# Pickled snapshot of the sample accounts, built once on first use;
+# subsequent initializations replay it with a single C-level unpickle
+# instead of reconstructing every dict and timestamp in Python
+_sample_snapshot = None
+
+
+def _build_sample_accounts():
+    """
+    Build the raw sample account dictionary.
+
+    Returns:
+        dict: Dictionary containing sample user accounts
+    """
+    # Sample accounts with different scenarios
+    accounts = {
+        '123456789': Account(
+            account_number='123456789',
+            name='John Smith',
+            pin_hash=hash_pin('1234'),
+            balance=1500.00,
+            transaction_history=deque([
+                {
+                    'date': _days_ago_ns(5),
+                    'type': 'Deposit',
+                    'amount': 500.00,
+                    'balance_after': 1000.00
+                },
+                {
+                    'date': _days_ago_ns(3),
+                    'type': 'Withdrawal',
+                    'amount': 200.00,
+                    'balance_after': 800.00
+                },
+                {
+                    'date': _days_ago_ns(1),
+                    'type': 'Deposit',
+                    'amount': 700.00,
+                    'balance_after': 1500.00
+                }
+            ], maxlen=HISTORY_LIMIT)
+        ),
+        '987654321': Account(
+            account_number='987654321',
+            name='Jane Doe',
+            pin_hash=hash_pin('5678'),
+            balance=2750.50,
+            transaction_history=deque([
+                {
+                    'date': _days_ago_ns(7),
+                    'type': 'Deposit',
+                    'amount': 1000.00,
+                    'balance_after': 2000.00
+                },
+                {
+                    'date': _days_ago_ns(4),
+                    'type': 'Withdrawal',
+                    'amount': 250.00,
+                    'balance_after': 1750.00
+                },
+                {
+                    'date': _days_ago_ns(2),
+                    'type': 'Deposit',
+                    'amount': 1000.50,
+                    'balance_after': 2750.50
+                }
+            ], maxlen=HISTORY_LIMIT)
+        ),
+        '555666777': Account(
+            account_number='555666777',
+            name='Bob Johnson',
+            pin_hash=hash_pin('9999'),
+            balance=50.00,
+            transaction_history=deque([
+                {
+                    'date': _days_ago_ns(10),
+                    'type': 'Deposit',
+                    'amount': 100.00,
+                    'balance_after': 100.00
+                },
+                {
+                    'date': _days_ago_ns(6),
+                    'type': 'Withdrawal',
+                    'amount': 50.00,
+                    'balance_after': 50.00
+                }
+            ], maxlen=HISTORY_LIMIT)
+        ),
+        '111222333': Account(
+            account_number='111222333',
+            name='Alice Brown',
+            pin_hash=hash_pin('0000'),
+            balance=5000.00,
+            failed_attempts=2  # Account with failed attempts
+        ),
+        '444555666': Account(
+            account_number='444555666',
+            name='Charlie Wilson',
+            pin_hash=hash_pin('1111'),
+            balance=750.25,
+            failed_attempts=3,
+            locked=True  # Locked account for testing
+        )
+    }
+
+    return accounts
+
+
+def initialize_sample_data():
+    """
+    Initialize sample account data for testing the ATM system.
+
+    Returns:
+        dict: Dictionary containing sample user accounts
+    """
+    global _sample_snapshot
+    if _sample_snapshot is None:
+        _sample_snapshot = pickle.dumps(_build_sample_accounts(),
+                                        protocol=pickle.HIGHEST_PROTOCOL)
+
+    accounts = pickle.loads(_sample_snapshot)
+
+    # Intern the small immutable strings (account numbers, transaction
+    # types) so repeated dict lookups and equality checks hit CPython's
+    # pointer-identity fast path. Unpickling doesn't preserve interning, so
+    # this pass runs on every snapshot replay.
+    accounts = {sys.intern(acc_num): account for acc_num, account in accounts.items()}
+    for account in accounts.values():
+        account.account_number = sys.intern(account.account_number)
+        for transaction in account.transaction_history:
+            transaction['type'] = sys.intern(transaction['type'])
+
+    return accounts
+
+
+def _json_default(obj):
+    """
+    Teach the JSON encoder about the containers accounts are stored in.
+
+    Only the persistent Account fields are emitted; the underscored display
+    caches are derived and rebuilt on load.
+    """
+    if isinstance(obj, Account):
+        return {
+            'account_number': obj.account_number,
+            'name': obj.name,
+            'pin_hash': obj.pin_hash.hex(),
+            'balance': obj.balance,
+            'failed_attempts': obj.failed_attempts,
+            'locked': obj.locked,
+            # Strip the memoized display strings from each transaction;
+            # they are derived and rebuilt lazily after a load
+            'transaction_history': [
+                {k: v for k, v in txn.items() if not k.startswith('_')}
+                for txn in obj.transaction_history
+            ],
+        }
+    if isinstance(obj, deque):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def save_account_data(accounts, filename='accounts.json'):
+    """
+    Save account data to a JSON file.
+    
+    Args:
+        accounts (dict): Dictionary of user accounts
+        filename (str): Name of the file to save to
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        # The encoder converts Accounts and history deques on the fly via
+        # _json_default, so no intermediate copy of the data is built.
+        # Write to a temp file and atomically rename it over the target, so
+        # an interrupted save can never leave a truncated accounts file.
+        tmp_filename = filename + ".tmp"
+        if orjson is not None:
+            with open(tmp_filename, 'wb') as file:
+                # OPT_PASSTHROUGH_DATACLASS routes Account through
+                # _json_default instead of orjson's native dataclass
+                # handling, so both encoders emit the same document
+                file.write(orjson.dumps(
+                    accounts,
+                    default=_json_default,
+                    option=(orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC
+                            | orjson.OPT_PASSTHROUGH_DATACLASS)))
+                file.flush()
+                os.fsync(file.fileno())
+        else:
+            with open(tmp_filename, 'w') as file:
+                json.dump(accounts, file, indent=4, default=_json_default)
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(tmp_filename, filename)
+
+        return True
+    
+    except Exception as e:
+        print(f"Error saving account data: {e}")
+        return False
+
+
+def load_account_data(filename='accounts.json'):
+    """
+    Load account data from a JSON file.
+    
+    Args:
+        filename (str): Name of the file to load from
+        
+    Returns:
+        dict: Dictionary of user accounts, or None if file doesn't exist
+    """
+    try:
+        if not os.path.exists(filename):
+            return None
+        
+        if orjson is not None:
+            with open(filename, 'rb') as file:
+                accounts = orjson.loads(file.read())
+        else:
+            with open(filename, 'r') as file:
+                accounts = json.load(file)
+        
+        # Rebuild Account objects and their bounded history deques.
+        # Timestamps serialize as plain ints, so only legacy files need
+        # their ISO strings converted; sniff one record per account instead
+        # of type-checking every row.
+        for acc_num, raw in accounts.items():
+            history = raw.get('transaction_history', [])
+            if history and isinstance(history[0]['date'], str):
+                for transaction in history:
+                    transaction['date'] = int(
+                        datetime.fromisoformat(transaction['date']).timestamp() * 1e9)
+            accounts[acc_num] = Account(
+                account_number=sys.intern(raw['account_number']),
+                name=raw['name'],
+                # Legacy files stored the PIN in plaintext; hash it on the
+                # way in so nothing downstream ever sees it
+                pin_hash=(bytes.fromhex(raw['pin_hash'])
+                          if 'pin_hash' in raw else hash_pin(raw['pin'])),
+                balance=raw['balance'],
+                failed_attempts=raw.get('failed_attempts', 0),
+                locked=raw.get('locked', False),
+                transaction_history=deque(history, maxlen=HISTORY_LIMIT),
+            )
+
+        return accounts
+    
+    except Exception as e:
+        print(f"Error loading account data: {e}")
+        return None
+
+
+def create_new_account(account_number, name, pin, initial_balance=0.00):
+    """
+    Create a new user account.
+    
+    Args:
+        account_number (str): Unique account number
+        name (str): Account holder's name
+        pin (str): 4-digit PIN
+        initial_balance (float): Starting balance
+        
+    Returns:
+        Account: New account data
+    """
+    return Account(
+        account_number=sys.intern(account_number),
+        name=name,
+        pin_hash=hash_pin(pin),
+        balance=initial_balance,
+    )
+
+
+def get_account(accounts, account_number):
+    """
+    Retrieve account data by account number.
+    
+    Args:
+        accounts (dict): Dictionary of all accounts
+        account_number (str): Account number to search for
+        
+    Returns:
+        Account or None: Account data if found, None otherwise
+    """
+    return accounts.get(account_number)
+
+
+def account_exists(accounts, account_number):
+    """
+    Check if an account exists.
+    
+    Args:
+        accounts (dict): Dictionary of all accounts
+        account_number (str): Account number to check
+        
+    Returns:
+        bool: True if account exists, False otherwise
+    """
+    return account_number in accounts
+
+
+def accounts_exist_batch(accounts, account_numbers):
+    """
+    Check many account numbers for existence in one set operation.
+
+    Useful for bulk paths (imports, batch validation) where looping over
+    account_exists would pay Python call overhead per number; a dict keys
+    view supports set algebra directly, so the whole check runs in C.
+
+    Args:
+        accounts (dict): Dictionary of all accounts
+        account_numbers (iterable): Account numbers to check
+
+    Returns:
+        set: The subset of account_numbers that exist
+    """
+    return accounts.keys() & set(account_numbers)
+
+
+def update_account(accounts, account_number, updated_data):
+    """
+    Update account data.
+    
+    Args:
+        accounts (dict): Dictionary of all accounts
+        account_number (str): Account number to update
+        updated_data (dict): Updated account data
+        
+    Returns:
+        bool: True if successful, False if account not found
+    """
+    if account_number in accounts:
+        account = accounts[account_number]
+        for key, value in updated_data.items():
+            setattr(account, key, value)
+        return True
+    return False
+
+
+def delete_account(accounts, account_number):
+    """
+    Delete an account (admin function).
+    
+    Args:
+        accounts (dict): Dictionary of all accounts
+        account_number (str): Account number to delete
+        
+    Returns:
+        bool: True if successful, False if account not found
+    """
+    if account_number in accounts:
+        del accounts[account_number]
+        return True
+    return False
+
+
+def get_all_accounts(accounts):
+    """
+    Get all account numbers and names (admin function).
+    
+    Args:
+        accounts (dict): Dictionary of all accounts
+        
+    Returns:
+        list: List of tuples (account_number, name)
+    """
+    return [(acc_num, acc.name) for acc_num, acc in accounts.items()]
+
+
+def count_locked_accounts(accounts):
+    """
+    Count how many accounts are currently locked (admin function).
+
+    Args:
+        accounts (dict): Dictionary of all accounts
+
+    Returns:
+        int: Number of locked accounts
+    """
+    return sum(1 for account in accounts.values() if account.locked)
+
+
+def total_balance(accounts):
+    """
+    Sum the balances of all accounts in a single pass (admin function).
+
+    Args:
+        accounts (dict): Dictionary of all accounts
+
+    Returns:
+        float: Combined balance of every account
+    """
+    return sum(account.balance for account in accounts.values())
+
+
+def reset_all_failed_attempts(accounts):
+    """
+    Reset the failed-attempt counter on every account (admin function).
+
+    Intended for scheduled maintenance, e.g. a nightly reset job.
+
+    Args:
+        accounts (dict): Dictionary of all accounts
+
+    Returns:
+        int: Number of accounts that had a non-zero counter
+    """
+    reset_count = 0
+    for account in accounts.values():
+        if account.failed_attempts:
+            account.failed_attempts = 0
+            reset_count += 1
+    return reset_count
+
+
+def backup_accounts(accounts, backup_filename=None):
+    """
+    Create a backup of all account data.
+    
+    Args:
+        accounts (dict): Dictionary of all accounts
+        backup_filename (str): Optional backup filename
+        
+    Returns:
+        str or None: Backup filename if successful, None otherwise
+    """
+    if backup_filename is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        backup_filename = f"accounts_backup_{timestamp}.json"
+    
     return backup_filename if save_account_data(accounts, backup_filename) else None
\ No newline at end of file
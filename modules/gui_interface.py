@@ -1,391 +1,598 @@
-"""
-GUI Interface Module
-Handles all user interface elements using Tkinter for graphical interface.
-"""
-
-import tkinter as tk
-from tkinter import messagebox, simpledialog, ttk
-import getpass
-
-class ATMInterface:
-    def __init__(self, root, accounts):
-        """
-        Initialize the ATM GUI interface.
-        
-        Args:
-            root: Tkinter root window
-            accounts (dict): Dictionary of all user accounts
-        """
-        self.root = root
-        self.root.title("ATM Simulator")
-        self.root.geometry("600x500")
-        self.setup_styles()
-        
-        # Main container
-        self.main_frame = ttk.Frame(root, padding="20")
-        self.main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Current screen tracking
-        self.current_screen = None
-        self.accounts = accounts
-        self.current_account = None
-        self.atm = None
-        
-    def setup_styles(self):
-        """Configure custom styles for widgets."""
-        style = ttk.Style()
-        style.configure('TButton', font=('Arial', 12), padding=10)
-        style.configure('TLabel', font=('Arial', 12))
-        style.configure('Title.TLabel', font=('Arial', 16, 'bold'))
-        
-    def display_login(self):
-        """Display login screen."""
-        self.clear_screen()
-        
-        title = ttk.Label(self.main_frame, text="🏧 ATM LOGIN 🏧",
-                         style='Title.TLabel')
-        title.pack(pady=20)
-        
-        # Account number entry
-        ttk.Label(self.main_frame, text="Account Number:").pack()
-        self.account_entry = ttk.Entry(self.main_frame)
-        self.account_entry.pack(pady=5)
-        
-        # PIN entry
-        ttk.Label(self.main_frame, text="PIN:").pack()
-        self.pin_entry = ttk.Entry(self.main_frame, show="*")
-        self.pin_entry.pack(pady=5)
-        
-        # Login button
-        login_btn = ttk.Button(self.main_frame, text="Login",
-                             command=self.handle_login)
-        login_btn.pack(pady=20)
-        
-    def handle_login(self):
-        """Handle login attempt."""
-        account_number = self.account_entry.get().strip()
-        pin = self.pin_entry.get()
-        
-        if not account_number or not pin:
-            self.display_error("Please enter both account number and PIN")
-            return
-            
-        if account_number not in self.accounts:
-            self.display_error("Account not found")
-            return
-            
-        account = self.accounts[account_number]
-        
-        if account['locked']:
-            self.display_error("Account locked. Please contact support.")
-            return
-            
-        if account['pin'] != pin:
-            account['failed_attempts'] += 1
-            if account['failed_attempts'] >= 3:
-                account['locked'] = True
-                self.display_error("Account locked due to multiple failed attempts")
-            else:
-                remaining = 3 - account['failed_attempts']
-                self.display_error(f"Incorrect PIN. {remaining} attempts remaining")
-            return
-            
-        # Successful login
-        account['failed_attempts'] = 0
-        self.current_account = account
-        from modules.atm_operations import ATMOperations
-        self.atm = ATMOperations(account)
-        self.display_menu()
-
-    def display_welcome(self):
-        """Display welcome screen."""
-        self.clear_screen()
-        
-        title = ttk.Label(self.main_frame, text="🏦 WELCOME TO ATM 🏦", 
-                         style='Title.TLabel')
-        title.pack(pady=20)
-        
-        info = ttk.Label(self.main_frame, 
-                        text="Secure Banking System\n\n"
-                             "📍 Location: Main Branch ATM\n"
-                             "🕒 Available 24/7\n"
-                             "🔒 Secure & Encrypted")
-        info.pack(pady=20)
-        
-        start_btn = ttk.Button(self.main_frame, text="Start", 
-                              command=self.display_login)
-        start_btn.pack(pady=20)
-        
-    def display_menu(self):
-        """Display main ATM menu options."""
-        self.clear_screen()
-        
-        title = ttk.Label(self.main_frame, text="🏧 ATM MAIN MENU 🏧", 
-                         style='Title.TLabel')
-        title.pack(pady=20)
-        
-        # Menu buttons
-        menu_options = [
-            ("💰 View Balance", self.view_balance),
-            ("💵 Deposit Money", self.deposit_money),
-            ("💸 Withdraw Money", self.withdraw_money),
-            ("🔐 Change PIN", self.change_pin),
-            ("📄 Mini Statement", self.mini_statement),
-            ("🚪 Exit", self.exit_atm)
-        ]
-        
-        for text, command in menu_options:
-            btn = ttk.Button(self.main_frame, text=text, command=command)
-            btn.pack(fill=tk.X, pady=5)
-            
-    def clear_screen(self):
-        """Clear all widgets from the main frame."""
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
-    
-    def view_balance(self):
-        """Display current account balance."""
-        self.clear_screen()
-        
-        title = ttk.Label(self.main_frame, text="💰 BALANCE INQUIRY 💰", 
-                         style='Title.TLabel')
-        title.pack(pady=20)
-        
-        account = self.atm.account
-        info = ttk.Label(self.main_frame, 
-                        text=f"Account Holder: {account['name']}\n"
-                             f"Current Balance: ${account['balance']:,.2f}")
-        info.pack(pady=20)
-        
-        back_btn = ttk.Button(self.main_frame, text="Back to Menu",
-                            command=self.display_menu)
-        back_btn.pack(pady=20, padx=20, fill=tk.X)
-        
-    def deposit_money(self):
-        """Handle money deposit operation."""
-        self.clear_screen()
-        
-        title = ttk.Label(self.main_frame, text="💵 DEPOSIT MONEY 💵", 
-                         style='Title.TLabel')
-        title.pack(pady=20)
-        
-        amount = self.get_user_input("Enter deposit amount: $")
-        if not amount:
-            return
-            
-        try:
-            amount = float(amount)
-            if amount <= 0:
-                self.display_error("Deposit amount must be greater than zero.")
-                return
-                
-            # Process deposit
-            old_balance = self.atm.account['balance']
-            self.atm.account['balance'] += amount
-            
-            # Record transaction
-            from modules.transaction_manager import add_transaction
-            add_transaction(
-                self.atm.account,
-                transaction_type="Deposit",
-                amount=amount,
-                balance_after=self.atm.account['balance']
-            )
-            
-            self.display_success(
-                f"Deposit successful!\n\n"
-                f"Amount Deposited: ${amount:,.2f}\n"
-                f"Previous Balance: ${old_balance:,.2f}\n"
-                f"Current Balance: ${self.atm.account['balance']:,.2f}"
-            )
-            self.display_menu()
-            
-        except ValueError:
-            self.display_error("Invalid amount entered.")
-            
-    def withdraw_money(self):
-        """Handle money withdrawal operation."""
-        self.clear_screen()
-        
-        title = ttk.Label(self.main_frame, text="💸 WITHDRAW MONEY 💸", 
-                         style='Title.TLabel')
-        title.pack(pady=20)
-        
-        balance = ttk.Label(self.main_frame, 
-                          text=f"Available Balance: ${self.atm.account['balance']:,.2f}")
-        balance.pack(pady=10)
-        
-        amount = self.get_user_input("Enter withdrawal amount: $")
-        if not amount:
-            return
-            
-        try:
-            amount = float(amount)
-            if amount <= 0:
-                self.display_error("Withdrawal amount must be greater than zero.")
-                return
-                
-            if amount > self.atm.account['balance']:
-                self.display_error(
-                    f"Insufficient funds. Available balance: ${self.atm.account['balance']:,.2f}")
-                return
-                
-            # Process withdrawal
-            old_balance = self.atm.account['balance']
-            self.atm.account['balance'] -= amount
-            
-            # Record transaction
-            from modules.transaction_manager import add_transaction
-            add_transaction(
-                self.atm.account,
-                transaction_type="Withdrawal",
-                amount=amount,
-                balance_after=self.atm.account['balance']
-            )
-            
-            self.display_success(
-                f"Withdrawal successful!\n\n"
-                f"Amount Withdrawn: ${amount:,.2f}\n"
-                f"Previous Balance: ${old_balance:,.2f}\n"
-                f"Current Balance: ${self.atm.account['balance']:,.2f}"
-            )
-            self.display_menu()
-            
-        except ValueError:
-            self.display_error("Invalid amount entered.")
-            
-    def change_pin(self):
-        """Handle PIN change operation."""
-        self.clear_screen()
-        
-        title = ttk.Label(self.main_frame, text="🔐 CHANGE PIN 🔐", 
-                         style='Title.TLabel')
-        title.pack(pady=20)
-        
-        # Verify current PIN
-        current_pin = self.get_user_input("Enter current PIN: ", mask=True)
-        if not current_pin:
-            return
-            
-        if current_pin != self.atm.account['pin']:
-            self.display_error("Current PIN is incorrect.")
-            return
-            
-        # Get new PIN
-        new_pin = self.get_user_input("Enter new 4-digit PIN: ", mask=True)
-        if not new_pin:
-            return
-            
-        if new_pin == self.atm.account['pin']:
-            self.display_error("New PIN cannot be the same as current PIN.")
-            return
-            
-        # Confirm new PIN
-        confirm_pin = self.get_user_input("Confirm new PIN: ", mask=True)
-        if not confirm_pin:
-            return
-            
-        if new_pin != confirm_pin:
-            self.display_error("PINs do not match. Please try again.")
-            return
-            
-        # Update PIN
-        self.atm.account['pin'] = new_pin
-        
-        # Record transaction
-        from modules.transaction_manager import add_transaction
-        add_transaction(
-            self.atm.account,
-            transaction_type="PIN Change",
-            amount=0,
-            balance_after=self.atm.account['balance']
-        )
-        
-        self.display_success("PIN changed successfully!")
-        self.display_menu()
-        
-    def mini_statement(self):
-        """Display mini statement with last 5 transactions."""
-        self.clear_screen()
-        
-        title = ttk.Label(self.main_frame, text="📄 MINI STATEMENT 📄", 
-                         style='Title.TLabel')
-        title.pack(pady=20)
-        
-        account = self.atm.account
-        info = ttk.Label(self.main_frame, 
-                        text=f"Account Holder: {account['name']}\n"
-                             f"Account Number: {account['account_number']}\n"
-                             f"Current Balance: ${account['balance']:,.2f}")
-        info.pack(pady=10)
-        
-        from modules.transaction_manager import get_mini_statement
-        statement = get_mini_statement(account)
-        
-        if not statement:
-            ttk.Label(self.main_frame, text="No recent transactions found.").pack()
-        else:
-            # Create a frame for the statement table
-            table_frame = ttk.Frame(self.main_frame)
-            table_frame.pack(fill=tk.BOTH, expand=True, pady=10)
-            
-            # Create a treeview widget for the statement
-            tree = ttk.Treeview(table_frame, columns=('Date', 'Type', 'Amount', 'Balance'), show='headings')
-            tree.heading('Date', text='Date/Time')
-            tree.heading('Type', text='Type')
-            tree.heading('Amount', text='Amount')
-            tree.heading('Balance', text='Balance')
-            
-            # Add transactions to the treeview
-            for transaction in statement:
-                date_str = transaction['date'].strftime("%Y-%m-%d %H:%M")
-                amount_str = f"${transaction['amount']:,.2f}" if transaction['amount'] > 0 else "-"
-                balance_str = f"${transaction['balance_after']:,.2f}"
-                tree.insert('', tk.END, values=(date_str, transaction['type'], amount_str, balance_str))
-            
-            tree.pack(fill=tk.BOTH, expand=True)
-        
-        back_btn = ttk.Button(self.main_frame, text="Back to Menu",
-                            command=self.display_menu)
-        back_btn.pack(pady=20, padx=20, fill=tk.X)
-        
-    def exit_atm(self):
-        if messagebox.askyesno("Exit", "Are you sure you want to exit?"):
-            self.root.quit()
-    
-    def display_error(self, message):
-        """Display error message."""
-        messagebox.showerror("Error", message)
-        
-    def display_success(self, message):
-        """Display success message."""
-        messagebox.showinfo("Success", message)
-        
-    def display_info(self, message):
-        """Display information message."""
-        messagebox.showinfo("Information", message)
-        
-    def display_warning(self, message):
-        """Display warning message."""
-        messagebox.showwarning("Warning", message)
-        
-    def get_user_input(self, prompt, mask=False):
-        """Get user input with optional masking."""
-        if mask:
-            return simpledialog.askstring("Input", prompt, show='*')
-        return simpledialog.askstring("Input", prompt)
-        
-    def confirm_action(self, message):
-        """Ask user for confirmation."""
-        return messagebox.askyesno("Confirm", message)
-        
-    def pause_for_user(self):
-        """Pause execution until user continues."""
-        messagebox.showinfo("Continue", "Click OK to continue")
-
-def run_gui(accounts):
-    """Run the ATM GUI application."""
-    root = tk.Tk()
-    app = ATMInterface(root, accounts)
-    app.display_welcome()
-    root.mainloop()
+"""
+GUI Interface Module
+Handles all user interface elements using Tkinter for graphical interface.
+"""
+
+import tkinter as tk
+from tkinter import messagebox, simpledialog, ttk
+import tkinter.font as tkfont
+import hmac
+import re
+
+from modules.atm_operations import ATMOperations
+from modules.authentication import get_account_lock, hash_pin
+from modules.transaction_manager import (add_transaction, get_mini_statement,
+                                         _display_strings)
+from modules.user_interface import format_currency
+
+# Shape checks compiled once: malformed credentials are rejected before
+# any dict lookup or hashing, so a spam of bogus login attempts costs a
+# cheap DFA match per try
+_PIN_RE = re.compile(r'\A\d{4}\Z', re.ASCII)
+_ACCT_RE = re.compile(r'\A\d{6,12}\Z', re.ASCII)
+
+# Widget styles configured once per Tcl interpreter, not per
+# ATMInterface; each style.configure is a Tcl round-trip, so repeat
+# calls against the same root shouldn't redo them. The guard remembers
+# which root it ran against: a relaunch creates a fresh root (and
+# interpreter), which must get its own theme, styles and fonts.
+_styles_root = None
+
+# Named Font objects created once per interpreter in init_styles and
+# shared by every style; passing raw ('Arial', 12) tuples would make Tk
+# resolve the font per widget, a named font is resolved once. The dict
+# also keeps the handles alive.
+_fonts = {}
+
+
+def init_styles(root):
+    """Configure custom widget styles on root's interpreter; safe to
+    call more than once per root."""
+    global _styles_root
+    if _styles_root is root:
+        return
+    _styles_root = root
+
+    _fonts['body'] = tkfont.Font(root=root, family='Arial', size=12)
+    _fonts['title'] = tkfont.Font(root=root, family='Arial', size=16,
+                                  weight='bold')
+
+    style_table = {
+        'TButton': {'font': _fonts['body'], 'padding': 10},
+        'TLabel': {'font': _fonts['body']},
+        'Title.TLabel': {'font': _fonts['title']},
+    }
+
+    style = ttk.Style(root)
+    style.theme_use('clam')
+    for name, options in style_table.items():
+        style.configure(name, **options)
+
+
+class ATMInterface:
+    def __init__(self, root, accounts):
+        """
+        Initialize the ATM GUI interface.
+
+        Args:
+            root: Tkinter root window
+            accounts (dict): Dictionary of all user accounts
+        """
+        self.root = root
+        self.root.title("ATM Simulator")
+        self.root.geometry("600x500")
+        init_styles(root)
+
+        # Main container
+        self.main_frame = ttk.Frame(root, padding="20")
+        self.main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Non-modal status bar for success feedback; a messagebox would
+        # spin a nested event loop and block until dismissed
+        self.status_var = tk.StringVar()
+        self._status_clear_id = None
+        status_bar = ttk.Label(self.main_frame, textvariable=self.status_var,
+                               foreground='green', anchor=tk.CENTER)
+        status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+
+        self.accounts = accounts
+        self.current_account = None
+        self.atm = None
+        self._menu_dirty = False
+
+        # Build every screen once and switch between them with pack/
+        # pack_forget, instead of destroying and recreating widgets on
+        # each navigation
+        self.screens = {}
+        self._current = None
+        self._build_welcome_frame()
+        self._build_login_frame()
+        self._build_menu_frame()
+        self._build_balance_frame()
+        self._build_deposit_frame()
+        self._build_withdraw_frame()
+        self._build_change_pin_frame()
+        self._build_statement_frame()
+        self._build_exit_dialog()
+
+    def _show(self, name):
+        """Swap the visible screen; an O(1) pack toggle, no widget churn."""
+        frame = self.screens[name]
+        if self._current is frame:
+            return
+        if self._current is not None:
+            self._current.pack_forget()
+        frame.pack(fill=tk.BOTH, expand=True)
+        self._current = frame
+
+    def _build_welcome_frame(self):
+        """Build the welcome screen once."""
+        frame = ttk.Frame(self.main_frame)
+
+        title = ttk.Label(frame, text="🏦 WELCOME TO ATM 🏦",
+                         style='Title.TLabel')
+        title.pack(pady=20)
+
+        info = ttk.Label(frame,
+                        text="Secure Banking System\n\n"
+                             "📍 Location: Main Branch ATM\n"
+                             "🕒 Available 24/7\n"
+                             "🔒 Secure & Encrypted")
+        info.pack(pady=20)
+
+        start_btn = ttk.Button(frame, text="Start",
+                              command=self.display_login)
+        start_btn.pack(pady=20)
+
+        self.screens['welcome'] = frame
+
+    def _build_login_frame(self):
+        """Build the login screen once."""
+        frame = ttk.Frame(self.main_frame)
+
+        title = ttk.Label(frame, text="🏧 ATM LOGIN 🏧",
+                         style='Title.TLabel')
+        title.pack(pady=20)
+
+        # Account number entry
+        ttk.Label(frame, text="Account Number:").pack()
+        self.account_entry = ttk.Entry(frame)
+        self.account_entry.pack(pady=5)
+
+        # PIN entry
+        ttk.Label(frame, text="PIN:").pack()
+        self.pin_entry = ttk.Entry(frame, show="*")
+        self.pin_entry.pack(pady=5)
+
+        # Login button
+        login_btn = ttk.Button(frame, text="Login",
+                             command=self.handle_login)
+        login_btn.pack(pady=20)
+
+        self.screens['login'] = frame
+
+    def _build_menu_frame(self):
+        """Build the main menu screen once."""
+        frame = ttk.Frame(self.main_frame)
+
+        title = ttk.Label(frame, text="🏧 ATM MAIN MENU 🏧",
+                         style='Title.TLabel')
+        title.pack(pady=20)
+
+        # Menu buttons
+        menu_options = [
+            ("💰 View Balance", self.view_balance),
+            ("💵 Deposit Money", self.deposit_money),
+            ("💸 Withdraw Money", self.withdraw_money),
+            ("🔐 Change PIN", self.change_pin),
+            ("📄 Mini Statement", self.mini_statement),
+            ("🚪 Exit", self.exit_atm)
+        ]
+
+        for text, command in menu_options:
+            btn = ttk.Button(frame, text=text, command=command)
+            btn.pack(fill=tk.X, pady=5)
+
+        self.screens['menu'] = frame
+
+    def _build_balance_frame(self):
+        """Build the balance screen once; only its text changes per visit."""
+        frame = ttk.Frame(self.main_frame)
+
+        title = ttk.Label(frame, text="💰 BALANCE INQUIRY 💰",
+                         style='Title.TLabel')
+        title.pack(pady=20)
+
+        # textvariable binding: updating the balance is one Tcl variable
+        # set instead of a label reconfigure
+        self.balance_text = tk.StringVar()
+        balance_info = ttk.Label(frame, textvariable=self.balance_text)
+        balance_info.pack(pady=20)
+
+        back_btn = ttk.Button(frame, text="Back to Menu",
+                            command=self.display_menu)
+        back_btn.pack(pady=20, padx=20, fill=tk.X)
+
+        self.screens['balance'] = frame
+
+    def _build_deposit_frame(self):
+        """Build the deposit screen once."""
+        frame = ttk.Frame(self.main_frame)
+
+        title = ttk.Label(frame, text="💵 DEPOSIT MONEY 💵",
+                         style='Title.TLabel')
+        title.pack(pady=20)
+
+        self.screens['deposit'] = frame
+
+    def _build_withdraw_frame(self):
+        """Build the withdrawal screen once."""
+        frame = ttk.Frame(self.main_frame)
+
+        title = ttk.Label(frame, text="💸 WITHDRAW MONEY 💸",
+                         style='Title.TLabel')
+        title.pack(pady=20)
+
+        self.avail_text = tk.StringVar()
+        avail_info = ttk.Label(frame, textvariable=self.avail_text)
+        avail_info.pack(pady=10)
+
+        self.screens['withdraw'] = frame
+
+    def _build_change_pin_frame(self):
+        """Build the PIN-change screen once."""
+        frame = ttk.Frame(self.main_frame)
+
+        title = ttk.Label(frame, text="🔐 CHANGE PIN 🔐",
+                         style='Title.TLabel')
+        title.pack(pady=20)
+
+        self.screens['change_pin'] = frame
+
+    def _build_statement_frame(self):
+        """Build the mini-statement screen once; the table area is filled
+        per visit."""
+        frame = ttk.Frame(self.main_frame)
+
+        title = ttk.Label(frame, text="📄 MINI STATEMENT 📄",
+                         style='Title.TLabel')
+        title.pack(pady=20)
+
+        self.statement_text = tk.StringVar()
+        statement_info = ttk.Label(frame, textvariable=self.statement_text)
+        statement_info.pack(pady=10)
+
+        # Container for the statement table; the treeview inside it is
+        # created once and refilled per visit
+        self.statement_table_frame = ttk.Frame(frame)
+        self.statement_table_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+
+        self.statement_empty_label = ttk.Label(
+            self.statement_table_frame, text="No recent transactions found.")
+
+        self.statement_tree = ttk.Treeview(
+            self.statement_table_frame,
+            columns=('Date', 'Type', 'Amount', 'Balance'),
+            show='headings')
+        self.statement_tree.heading('Date', text='Date/Time')
+        self.statement_tree.heading('Type', text='Type')
+        self.statement_tree.heading('Amount', text='Amount')
+        self.statement_tree.heading('Balance', text='Balance')
+
+        back_btn = ttk.Button(frame, text="Back to Menu",
+                            command=self.display_menu)
+        back_btn.pack(pady=20, padx=20, fill=tk.X)
+
+        self.screens['statement'] = frame
+
+    def display_login(self):
+        """Display login screen."""
+        self._show('login')
+
+    def handle_login(self):
+        """Handle login attempt."""
+        account_number = self.account_entry.get().strip()
+        pin = self.pin_entry.get()
+
+        if not account_number or not pin:
+            self.display_error("Please enter both account number and PIN")
+            return
+
+        # Reject malformed credentials before touching the accounts dict;
+        # only well-formed attempts reach the lookup, lock and hash work
+        if _ACCT_RE.match(account_number) is None:
+            self.display_error("Account number must be 6-12 digits")
+            return
+
+        if _PIN_RE.match(pin) is None:
+            self.display_error("PIN must be exactly 4 digits")
+            return
+
+        # Single hash lookup: fetch and existence-check in one go
+        account = self.accounts.get(account_number)
+        if account is None:
+            self.display_error("Account not found")
+            return
+
+        # Guard the attempt counter and locked flag against concurrent logins
+        with get_account_lock(account_number):
+            if account.locked:
+                self.display_error("Account locked. Please contact support.")
+                return
+
+            if not hmac.compare_digest(hash_pin(pin), account.pin_hash):
+                account.failed_attempts += 1
+                if account.failed_attempts >= 3:
+                    account.locked = True
+                    self.display_error("Account locked due to multiple failed attempts")
+                else:
+                    remaining = 3 - account.failed_attempts
+                    self.display_error(f"Incorrect PIN. {remaining} attempts remaining")
+                return
+
+            # Successful login
+            account.failed_attempts = 0
+        self.current_account = account
+        self.atm = ATMOperations(account)
+        self.display_menu()
+
+    def display_welcome(self):
+        """Display welcome screen."""
+        self._show('welcome')
+
+    def _schedule_menu_refresh(self):
+        """
+        Queue one menu refresh on the Tk idle queue.
+
+        Back-to-back transactions (scripted drivers, rapid clicking) would
+        otherwise trigger a synchronous redraw per call; the dirty flag
+        collapses any burst into a single refresh once the event loop goes
+        idle.
+        """
+        if not self._menu_dirty:
+            self._menu_dirty = True
+            self.root.after_idle(self._do_menu_refresh)
+
+    def _do_menu_refresh(self):
+        """Refresh the cached balance strings and return to the menu."""
+        self._menu_dirty = False
+        account = self.atm.account
+        self.balance_text.set(f"Account Holder: {account.name}\n"
+                              f"Current Balance: {account._balance_str}")
+        self.avail_text.set(f"Available Balance: {account._balance_str}")
+        self.display_menu()
+
+    def display_menu(self):
+        """Display main ATM menu options."""
+        self._show('menu')
+
+    def view_balance(self):
+        """Display current account balance."""
+        account = self.atm.account
+        self.balance_text.set(f"Account Holder: {account.name}\n"
+                              f"Current Balance: {account._balance_str}")
+        self._show('balance')
+
+    def deposit_money(self):
+        """Handle money deposit operation."""
+        self._show('deposit')
+
+        amount = self.get_user_input("Enter deposit amount: $")
+        if not amount:
+            return
+
+        try:
+            amount = float(amount)
+            if amount <= 0:
+                self.display_error("Deposit amount must be greater than zero.")
+                return
+
+            # Process deposit
+            self.atm.account.balance += amount
+            self.atm.account._balance_str = format_currency(self.atm.account.balance)
+
+            # Record transaction
+            add_transaction(
+                self.atm.account,
+                transaction_type="Deposit",
+                amount=amount,
+                balance_after=self.atm.account.balance
+            )
+
+            self.display_success(
+                f"Deposited {format_currency(amount)} — "
+                f"new balance {self.atm.account._balance_str}"
+            )
+            self._schedule_menu_refresh()
+
+        except ValueError:
+            self.display_error("Invalid amount entered.")
+
+    def withdraw_money(self):
+        """Handle money withdrawal operation."""
+        self.avail_text.set(
+            f"Available Balance: {self.atm.account._balance_str}")
+        self._show('withdraw')
+
+        amount = self.get_user_input("Enter withdrawal amount: $")
+        if not amount:
+            return
+
+        try:
+            amount = float(amount)
+            if amount <= 0:
+                self.display_error("Withdrawal amount must be greater than zero.")
+                return
+
+            if amount > self.atm.account.balance:
+                self.display_error(
+                    f"Insufficient funds. Available balance: {self.atm.account._balance_str}")
+                return
+
+            # Process withdrawal
+            self.atm.account.balance -= amount
+            self.atm.account._balance_str = format_currency(self.atm.account.balance)
+
+            # Record transaction
+            add_transaction(
+                self.atm.account,
+                transaction_type="Withdrawal",
+                amount=amount,
+                balance_after=self.atm.account.balance
+            )
+
+            self.display_success(
+                f"Withdrew {format_currency(amount)} — "
+                f"new balance {self.atm.account._balance_str}"
+            )
+            self._schedule_menu_refresh()
+
+        except ValueError:
+            self.display_error("Invalid amount entered.")
+
+    def change_pin(self):
+        """Handle PIN change operation."""
+        self._show('change_pin')
+
+        # Verify current PIN
+        current_pin = self.get_user_input("Enter current PIN: ", mask=True)
+        if not current_pin:
+            return
+
+        if not hmac.compare_digest(hash_pin(current_pin), self.atm.account.pin_hash):
+            self.display_error("Current PIN is incorrect.")
+            return
+
+        # Get new PIN
+        new_pin = self.get_user_input("Enter new 4-digit PIN: ", mask=True)
+        if not new_pin:
+            return
+
+        new_hash = hash_pin(new_pin)
+        if hmac.compare_digest(new_hash, self.atm.account.pin_hash):
+            self.display_error("New PIN cannot be the same as current PIN.")
+            return
+
+        # Confirm new PIN
+        confirm_pin = self.get_user_input("Confirm new PIN: ", mask=True)
+        if not confirm_pin:
+            return
+
+        if new_pin != confirm_pin:
+            self.display_error("PINs do not match. Please try again.")
+            return
+
+        # Update PIN
+        self.atm.account.pin_hash = new_hash
+
+        # Record transaction
+        add_transaction(
+            self.atm.account,
+            transaction_type="PIN Change",
+            amount=0,
+            balance_after=self.atm.account.balance
+        )
+
+        self.display_success("PIN changed successfully!")
+        self._schedule_menu_refresh()
+
+    def mini_statement(self):
+        """Display mini statement with last 5 transactions."""
+        account = self.atm.account
+        self.statement_text.set(f"Account Holder: {account.name}\n"
+                                f"Account Number: {account.account_number}\n"
+                                f"Current Balance: {account._balance_str}")
+
+        statement = get_mini_statement(account)
+
+        # Refill the persistent treeview instead of recreating the widget;
+        # delete + insert is far cheaper than widget construction
+        tree = self.statement_tree
+        tree.delete(*tree.get_children())
+
+        if not statement:
+            tree.pack_forget()
+            self.statement_empty_label.pack()
+        else:
+            self.statement_empty_label.pack_forget()
+
+            # Add transactions to the treeview using the memoized display
+            # strings; the short date form is a slice of the full one
+            for transaction in statement:
+                date_str, amount_str, balance_str = _display_strings(transaction)
+                if transaction['amount'] <= 0:
+                    amount_str = "-"
+                tree.insert('', tk.END, values=(date_str[:16], transaction['type'], amount_str, balance_str))
+
+            tree.pack(fill=tk.BOTH, expand=True)
+
+        self._show('statement')
+
+    def _build_exit_dialog(self):
+        """Build the exit confirmation dialog once, kept hidden.
+
+        Reusing a withdrawn Toplevel avoids the per-call window allocation
+        and nested event loop of messagebox.askyesno.
+        """
+        dlg = tk.Toplevel(self.root)
+        dlg.withdraw()
+        dlg.title("Exit")
+        dlg.resizable(False, False)
+        dlg.transient(self.root)
+        dlg.protocol("WM_DELETE_WINDOW", self._cancel_exit)
+
+        ttk.Label(dlg, text="Are you sure you want to exit?").pack(
+            padx=20, pady=15)
+
+        buttons = ttk.Frame(dlg)
+        buttons.pack(pady=(0, 15))
+        ttk.Button(buttons, text="Yes",
+                   command=self.root.quit).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="No",
+                   command=self._cancel_exit).pack(side=tk.LEFT, padx=5)
+
+        self._exit_dlg = dlg
+
+    def _cancel_exit(self):
+        """Hide the exit dialog without quitting."""
+        self._exit_dlg.grab_release()
+        self._exit_dlg.withdraw()
+
+    def exit_atm(self):
+        self._exit_dlg.deiconify()
+        # Mapping is asynchronous under X11; grabbing before the window
+        # is viewable raises "grab failed: window not viewable"
+        self._exit_dlg.wait_visibility()
+        self._exit_dlg.grab_set()
+
+    def display_error(self, message):
+        """Display error message."""
+        messagebox.showerror("Error", message)
+
+    def display_success(self, message):
+        """Show a success message in the status bar, cleared after 2.5s."""
+        self.status_var.set(message)
+        if self._status_clear_id is not None:
+            self.root.after_cancel(self._status_clear_id)
+        self._status_clear_id = self.root.after(
+            2500, lambda: self.status_var.set(""))
+
+    def display_info(self, message):
+        """Display information message."""
+        messagebox.showinfo("Information", message)
+
+    def display_warning(self, message):
+        """Display warning message."""
+        messagebox.showwarning("Warning", message)
+
+    def get_user_input(self, prompt, mask=False):
+        """Get user input with optional masking."""
+        if mask:
+            return simpledialog.askstring("Input", prompt, show='*')
+        return simpledialog.askstring("Input", prompt)
+
+    def confirm_action(self, message):
+        """Ask user for confirmation."""
+        return messagebox.askyesno("Confirm", message)
+
+    def pause_for_user(self):
+        """Pause execution until user continues."""
+        messagebox.showinfo("Continue", "Click OK to continue")
+
+def run_gui(accounts):
+    """Run the ATM GUI application."""
+    root = tk.Tk()
+    init_styles(root)
+    app = ATMInterface(root, accounts)
+    app.display_welcome()
+    root.mainloop()
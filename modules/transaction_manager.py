@@ -1,190 +1,428 @@
-"""
-Transaction Manager Module
-Handles transaction recording, history management, and mini statement generation.
-"""
-
-from datetime import datetime
-
-
-def add_transaction(account, transaction_type, amount, balance_after):
-    """
-    Add a new transaction to the account's transaction history.
-    
-    Args:
-        account (dict): User account data
-        transaction_type (str): Type of transaction (Deposit, Withdrawal, PIN Change)
-        amount (float): Transaction amount
-        balance_after (float): Account balance after transaction
-    """
-    transaction = {
-        'date': datetime.now(),
-        'type': transaction_type,
-        'amount': amount,
-        'balance_after': balance_after
-    }
-    
-    # Initialize transaction history if it doesn't exist
-    if 'transaction_history' not in account:
-        account['transaction_history'] = []
-    
-    # Add transaction to history
-    account['transaction_history'].append(transaction)
-    
-    # Keep only the last 10 transactions (more than mini statement needs)
-    if len(account['transaction_history']) > 10:
-        account['transaction_history'] = account['transaction_history'][-10:]
-
-
-def get_mini_statement(account):
-    """
-    Get the last 5 transactions for mini statement.
-    
-    Args:
-        account (dict): User account data
-        
-    Returns:
-        list: List of last 5 transactions, most recent first
-    """
-    if 'transaction_history' not in account:
-        return []
-    
-    # Return last 5 transactions, most recent first
-    return account['transaction_history'][-5:][::-1]
-
-
-def get_transaction_summary(account, days=30):
-    """
-    Get transaction summary for specified number of days.
-    
-    Args:
-        account (dict): User account data
-        days (int): Number of days to look back
-        
-    Returns:
-        dict: Transaction summary with counts and totals
-    """
-    if 'transaction_history' not in account:
-        return {
-            'total_transactions': 0,
-            'total_deposits': 0,
-            'total_withdrawals': 0,
-            'deposit_count': 0,
-            'withdrawal_count': 0
-        }
-    
-    # Calculate cutoff date
-    cutoff_date = datetime.now().replace(day=datetime.now().day - days) if days < datetime.now().day else datetime.now().replace(month=datetime.now().month - 1)
-    
-    summary = {
-        'total_transactions': 0,
-        'total_deposits': 0,
-        'total_withdrawals': 0,
-        'deposit_count': 0,
-        'withdrawal_count': 0
-    }
-    
-    for transaction in account['transaction_history']:
-        if transaction['date'] >= cutoff_date:
-            summary['total_transactions'] += 1
-            
-            if transaction['type'] == 'Deposit':
-                summary['total_deposits'] += transaction['amount']
-                summary['deposit_count'] += 1
-            elif transaction['type'] == 'Withdrawal':
-                summary['total_withdrawals'] += transaction['amount']
-                summary['withdrawal_count'] += 1
-    
-    return summary
-
-
-def format_transaction_for_display(transaction):
-    """
-    Format a single transaction for display purposes.
-    
-    Args:
-        transaction (dict): Transaction data
-        
-    Returns:
-        str: Formatted transaction string
-    """
-    date_str = transaction['date'].strftime("%Y-%m-%d %H:%M")
-    amount_str = f"${transaction['amount']:,.2f}" if transaction['amount'] > 0 else "N/A"
-    balance_str = f"${transaction['balance_after']:,.2f}"
-    
-    return f"{date_str} | {transaction['type']:<12} | {amount_str:<10} | Balance: {balance_str}"
-
-
-def export_transaction_history(account, filename=None):
-    """
-    Export transaction history to a text file.
-    
-    Args:
-        account (dict): User account data
-        filename (str): Optional filename, auto-generated if None
-        
-    Returns:
-        str: Filename of exported file
-    """
-    if filename is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"statement_{account['account_number']}_{timestamp}.txt"
-    
-    try:
-        with open(filename, 'w') as file:
-            file.write("="*60 + "\n")
-            file.write("              TRANSACTION HISTORY EXPORT\n")
-            file.write("="*60 + "\n")
-            file.write(f"Account Holder: {account['name']}\n")
-            file.write(f"Account Number: {account['account_number']}\n")
-            file.write(f"Export Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            file.write(f"Current Balance: ${account['balance']:,.2f}\n")
-            file.write("="*60 + "\n\n")
-            
-            if 'transaction_history' not in account or not account['transaction_history']:
-                file.write("No transactions found.\n")
-            else:
-                file.write(f"{'Date/Time':<20} {'Type':<12} {'Amount':<12} {'Balance':<12}\n")
-                file.write("-" * 60 + "\n")
-                
-                for transaction in reversed(account['transaction_history']):
-                    date_str = transaction['date'].strftime("%Y-%m-%d %H:%M:%S")
-                    amount_str = f"${transaction['amount']:,.2f}" if transaction['amount'] > 0 else "-"
-                    balance_str = f"${transaction['balance_after']:,.2f}"
-                    file.write(f"{date_str:<20} {transaction['type']:<12} {amount_str:<12} {balance_str:<12}\n")
-            
-            file.write("\n" + "="*60 + "\n")
-            file.write("End of Statement\n")
-            file.write("="*60 + "\n")
-        
-        return filename
-    
-    except Exception as e:
-        print(f"Error exporting transaction history: {e}")
-        return None
-
-
-def clear_transaction_history(account):
-    """
-    Clear all transaction history for an account (admin function).
-    
-    Args:
-        account (dict): User account data
-    """
-    if 'transaction_history' in account:
-        account['transaction_history'] = []
-
-
-def get_last_transaction(account):
-    """
-    Get the most recent transaction for an account.
-    
-    Args:
-        account (dict): User account data
-        
-    Returns:
-        dict or None: Last transaction or None if no transactions
-    """
-    if 'transaction_history' not in account or not account['transaction_history']:
-        return None
-    
-    return account['transaction_history'][-1]
\ No newline at end of file
+"""
+Transaction Manager Module
+Handles transaction recording, history management, and mini statement generation.
+"""
+
+from collections import deque
+from datetime import datetime
+from itertools import islice
+import threading
+import time
+
+# Maximum number of transactions kept per account. Histories are stored in a
+# bounded deque so every append is O(1) and old entries are discarded
+# automatically instead of being trimmed with list copies.
+HISTORY_LIMIT = 200
+
+# Transaction timestamps are stored as integer nanoseconds since the epoch
+# (time.time_ns()); recording a transaction then skips datetime object
+# construction entirely, and the datetime is only built when a statement is
+# rendered.
+NS_PER_DAY = 86_400 * 1_000_000_000
+
+# Statement-export layout built once at import: separators, the column
+# header row and the banner template, so exports never re-multiply
+# separator strings or re-parse the header format
+_SEP60 = "=" * 60 + "\n"
+_DASH60 = "-" * 60 + "\n"
+_EXPORT_COLUMNS = f"{'Date/Time':<20} {'Type':<12} {'Amount':<12} {'Balance':<12}\n"
+_EXPORT_HEADER_FMT = (
+    _SEP60
+    + "              TRANSACTION HISTORY EXPORT\n"
+    + _SEP60
+    + "Account Holder: {name}\n"
+    + "Account Number: {number}\n"
+    + "Export Date: {export_date}\n"
+    + "Current Balance: ${balance:,.2f}\n"
+    + _SEP60 + "\n"
+).format
+_EXPORT_FOOTER = "\n" + _SEP60 + "End of Statement\n" + _SEP60
+
+
+def _now_ns():
+    """
+    Current time as integer nanoseconds since the epoch.
+    """
+    return time.time_ns()
+
+
+def transaction_datetime(transaction):
+    """
+    Build the datetime for a transaction's stored timestamp.
+
+    Args:
+        transaction (dict): Transaction data
+
+    Returns:
+        datetime: Timestamp of the transaction
+    """
+    return datetime.fromtimestamp(transaction['date'] / 1e9)
+
+
+def _display_strings(transaction):
+    """
+    Get the cached display strings for a transaction, formatting them once.
+
+    strftime and f-string money formatting are the dominant cost of
+    rendering a statement row; each transaction is immutable after
+    recording, so the formatted strings are memoized on the dict and every
+    later render is a plain key lookup. The underscored keys are display
+    caches and are stripped before persistence.
+
+    Args:
+        transaction (dict): Transaction data
+
+    Returns:
+        tuple: (date_str, amount_str, balance_str)
+    """
+    date_str = transaction.get('_date_str')
+    if date_str is None:
+        date_str = transaction_datetime(transaction).strftime("%Y-%m-%d %H:%M:%S")
+        transaction['_date_str'] = date_str
+        transaction['_amount_str'] = f"${transaction['amount']:,.2f}"
+        transaction['_balance_str'] = f"${transaction['balance_after']:,.2f}"
+    return date_str, transaction['_amount_str'], transaction['_balance_str']
+
+# Write-behind persistence: instead of saving to disk on every transaction,
+# add_transaction enqueues a marker and a background thread flushes the
+# accounts file once per batch (or once per interval), amortizing the JSON
+# encode and disk write across many transactions.
+_FLUSH_EVERY = 50      # flush after this many queued transactions
+_FLUSH_INTERVAL = 5.0  # ... or after this many seconds, whichever is first
+
+_txn_queue = deque()
+_flush_event = threading.Event()
+_flush_thread = None
+_write_behind_target = None  # (accounts, filename) once enabled
+
+
+def enable_write_behind(accounts, filename='accounts.json'):
+    """
+    Enable batched background persistence of account data.
+
+    Once enabled, every recorded transaction enqueues a dirty marker and a
+    daemon thread saves the accounts file in batches instead of the caller
+    paying for a disk write per transaction.
+
+    Args:
+        accounts (dict): Dictionary of all user accounts
+        filename (str): File the background thread saves to
+    """
+    global _write_behind_target, _flush_thread
+    _write_behind_target = (accounts, filename)
+
+    if _flush_thread is None:
+        _flush_thread = threading.Thread(target=_flush_loop, daemon=True)
+        _flush_thread.start()
+
+
+def flush_pending_transactions():
+    """
+    Immediately persist any queued transactions.
+
+    Intended for shutdown paths so the final batch isn't lost when the
+    daemon flush thread dies with the process.
+    """
+    if _write_behind_target is None or not _txn_queue:
+        return
+
+    # Imported lazily to avoid a circular import with modules.database
+    from modules.database import save_account_data
+
+    accounts, filename = _write_behind_target
+    _txn_queue.clear()
+    save_account_data(accounts, filename)
+
+
+def _flush_loop():
+    """
+    Background loop that drains the transaction queue in batches.
+    """
+    while True:
+        _flush_event.wait(_FLUSH_INTERVAL)
+        _flush_event.clear()
+        flush_pending_transactions()
+
+
+def add_transaction(account, transaction_type, amount, balance_after):
+    """
+    Add a new transaction to the account's transaction history.
+
+    Args:
+        account (Account): User account data
+        transaction_type (str): Type of transaction (Deposit, Withdrawal, PIN Change)
+        amount (float): Transaction amount
+        balance_after (float): Account balance after transaction
+    """
+    transaction = {
+        'date': _now_ns(),
+        'type': transaction_type,
+        'amount': amount,
+        'balance_after': balance_after
+    }
+
+    # Add transaction to history and invalidate the cached mini statement
+    account.transaction_history.append(transaction)
+    account._mini_cache = None
+
+    # Queue the account for the write-behind flusher; enqueueing is O(1)
+    # and non-blocking, so the caller never waits on disk
+    if _write_behind_target is not None:
+        _txn_queue.append(account.account_number)
+        if len(_txn_queue) >= _FLUSH_EVERY:
+            _flush_event.set()
+
+
+def get_mini_statement(account):
+    """
+    Get the last 5 transactions for mini statement.
+
+    Args:
+        account (Account): User account data
+
+    Returns:
+        list: List of last 5 transactions, most recent first
+    """
+    # Serve the memoized statement when the history hasn't changed since
+    # the last call (common balance-check -> statement flows)
+    cached = account._mini_cache
+    if cached is not None:
+        return cached
+
+    # Return last 5 transactions, most recent first, without copying the
+    # full history
+    statement = list(islice(reversed(account.transaction_history), 5))
+    account._mini_cache = statement
+    return statement
+
+
+# Analytics kernel: histories are transposed into parallel numeric columns
+# (struct-of-arrays) so the aggregation loop touches only ints and floats —
+# no dicts, strings or attribute access. That layout keeps the kernel
+# JIT-compilable as-is (e.g. numba.njit over int64/float64 arrays) should a
+# compiled backend ever be worth adding for batch reporting; numba is not a
+# dependency of this project, so it runs as a tight CPython loop here.
+_TYPE_CODES = {'Deposit': 1, 'Withdrawal': 2}
+
+
+def _encode_history(history):
+    """
+    Transpose a transaction history into parallel numeric columns.
+
+    Transaction types are encoded as small ints (Deposit=1, Withdrawal=2,
+    anything else 0) so the kernel never compares strings.
+
+    Args:
+        history (iterable): Chronological transaction dicts
+
+    Returns:
+        tuple: (dates, kinds, amounts) parallel lists
+    """
+    dates = []
+    kinds = []
+    amounts = []
+    code_of = _TYPE_CODES.get
+    for transaction in history:
+        dates.append(transaction['date'])
+        kinds.append(code_of(transaction['type'], 0))
+        amounts.append(transaction['amount'])
+    return dates, kinds, amounts
+
+
+def _summarize_rows(dates, kinds, amounts, cutoff_ns):
+    """
+    Aggregate encoded transaction rows newer than a cutoff.
+
+    Rows are chronological, so the loop walks them newest-first and stops
+    at the first row older than the cutoff.
+
+    Args:
+        dates (list): Timestamps in epoch nanoseconds
+        kinds (list): Type codes from _encode_history
+        amounts (list): Transaction amounts
+        cutoff_ns (int): Oldest timestamp to include
+
+    Returns:
+        tuple: (total, deposits, withdrawals, deposit_count, withdrawal_count)
+    """
+    total = 0
+    total_deposits = 0.0
+    total_withdrawals = 0.0
+    deposit_count = 0
+    withdrawal_count = 0
+
+    for i in range(len(dates) - 1, -1, -1):
+        if dates[i] < cutoff_ns:
+            break
+        total += 1
+        kind = kinds[i]
+        if kind == 1:
+            total_deposits += amounts[i]
+            deposit_count += 1
+        elif kind == 2:
+            total_withdrawals += amounts[i]
+            withdrawal_count += 1
+
+    return (total, total_deposits, total_withdrawals,
+            deposit_count, withdrawal_count)
+
+
+def get_transaction_summary(account, days=30):
+    """
+    Get transaction summary for specified number of days.
+
+    Args:
+        account (Account): User account data
+        days (int): Number of days to look back
+
+    Returns:
+        dict: Transaction summary with counts and totals
+    """
+    # Calculate cutoff timestamp in nanoseconds
+    cutoff_date = _now_ns() - days * NS_PER_DAY
+
+    dates, kinds, amounts = _encode_history(account.transaction_history)
+    (total, deposits, withdrawals,
+     deposit_count, withdrawal_count) = _summarize_rows(
+        dates, kinds, amounts, cutoff_date)
+
+    return {
+        'total_transactions': total,
+        'total_deposits': deposits,
+        'total_withdrawals': withdrawals,
+        'deposit_count': deposit_count,
+        'withdrawal_count': withdrawal_count
+    }
+
+
+def summarize_all(accounts, days=30):
+    """
+    Summarize recent transactions for every account in one pass.
+
+    Batch-reporting counterpart of get_transaction_summary: the cutoff is
+    computed once and each history is fed through the numeric
+    encode/aggregate kernel, so the per-account Python overhead is one
+    function call pair rather than a fresh setup per account.
+
+    Args:
+        accounts (dict): Dictionary of all user accounts
+        days (int): Number of days to look back
+
+    Returns:
+        dict: Summary dict per account, keyed by account number
+    """
+    cutoff_date = _now_ns() - days * NS_PER_DAY
+
+    results = {}
+    for acc_num, account in accounts.items():
+        dates, kinds, amounts = _encode_history(account.transaction_history)
+        (total, deposits, withdrawals,
+         deposit_count, withdrawal_count) = _summarize_rows(
+            dates, kinds, amounts, cutoff_date)
+        results[acc_num] = {
+            'total_transactions': total,
+            'total_deposits': deposits,
+            'total_withdrawals': withdrawals,
+            'deposit_count': deposit_count,
+            'withdrawal_count': withdrawal_count
+        }
+
+    return results
+
+
+def format_transaction_for_display(transaction):
+    """
+    Format a single transaction for display purposes.
+    
+    Args:
+        transaction (dict): Transaction data
+        
+    Returns:
+        str: Formatted transaction string
+    """
+    # The short date form is a prefix of the cached full one, so slicing
+    # beats a second strftime call
+    date_str, amount_str, balance_str = _display_strings(transaction)
+    if transaction['amount'] <= 0:
+        amount_str = "N/A"
+
+    return f"{date_str[:16]} | {transaction['type']:<12} | {amount_str:<10} | Balance: {balance_str}"
+
+
+def export_transaction_history(account, filename=None):
+    """
+    Export transaction history to a text file.
+    
+    Args:
+        account (Account): User account data
+        filename (str): Optional filename, auto-generated if None
+        
+    Returns:
+        str: Filename of exported file
+    """
+    if filename is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"statement_{account.account_number}_{timestamp}.txt"
+    
+    try:
+        # Assemble the whole statement in memory and emit it with a single
+        # write; dozens of small file.write calls each pay Python-to-C call
+        # and buffer-management overhead
+        parts = [_EXPORT_HEADER_FMT(
+            name=account.name,
+            number=account.account_number,
+            export_date=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            balance=account.balance,
+        )]
+
+        if not account.transaction_history:
+            parts.append("No transactions found.\n")
+        else:
+            parts.append(_EXPORT_COLUMNS)
+            parts.append(_DASH60)
+
+            for transaction in reversed(account.transaction_history):
+                date_str, amount_str, balance_str = _display_strings(transaction)
+                if transaction['amount'] <= 0:
+                    amount_str = "-"
+                parts.append(f"{date_str:<20} {transaction['type']:<12} {amount_str:<12} {balance_str:<12}\n")
+
+        parts.append(_EXPORT_FOOTER)
+
+        with open(filename, 'w', buffering=1 << 16) as file:
+            file.write("".join(parts))
+
+        return filename
+    
+    except Exception as e:
+        print(f"Error exporting transaction history: {e}")
+        return None
+
+
+def clear_transaction_history(account):
+    """
+    Clear all transaction history for an account (admin function).
+    
+    Args:
+        account (Account): User account data
+    """
+    # Clear in place so existing references to the deque stay valid and no
+    # replacement container is allocated
+    account.transaction_history.clear()
+    account._mini_cache = None
+
+
+def get_last_transaction(account):
+    """
+    Get the most recent transaction for an account.
+    
+    Args:
+        account (Account): User account data
+        
+    Returns:
+        dict or None: Last transaction or None if no transactions
+    """
+    if not account.transaction_history:
+        return None
+    
+    return account.transaction_history[-1]
\ No newline at end of file
@@ -4,37 +4,72 @@ Handles all user interface elements including menus, prompts, and input collecti
 """
 
 import getpass
+import logging
 import sys
 
+# Gate for the error/warning feedback: batch callers (bulk imports,
+# stress drivers) can run logging.disable(logging.WARNING) and every
+# display_error collapses to a single level check instead of a TTY write
+_log = logging.getLogger("atm.validation")
+
+# Currency layout bound once at import so callers don't re-parse the
+# format spec on every amount they render
+_CURRENCY_FMT = "${:,.2f}".format
+
+# Immutable banners assembled once at import; each display call is then a
+# single stdout write instead of one locked write per print line
+WELCOME_BANNER = "\n".join([
+    "",
+    "=" * 60,
+    "                  🏦 WELCOME TO ATM 🏦",
+    "                   Secure Banking System",
+    "=" * 60,
+    "📍 Location: Main Branch ATM",
+    "🕒 Available 24/7",
+    "🔒 Secure & Encrypted",
+    "=" * 60,
+]) + "\n"
+
+MENU_TEXT = "\n".join([
+    "",
+    "=" * 50,
+    "               🏧 ATM MAIN MENU 🏧",
+    "=" * 50,
+    "1. 💰 View Balance",
+    "2. 💵 Deposit Money",
+    "3. 💸 Withdraw Money",
+    "4. 🔐 Change PIN",
+    "5. 📄 Mini Statement (Last 5 Transactions)",
+    "6. 🚪 Exit",
+    "=" * 50,
+]) + "\n"
+
+
+def format_currency(amount):
+    """
+    Format an amount as a dollar string, e.g. 1234.5 -> '$1,234.50'.
+
+    Args:
+        amount (float): Amount to format
+
+    Returns:
+        str: Formatted currency string
+    """
+    return _CURRENCY_FMT(amount)
+
 
 def display_welcome():
     """
     Display welcome banner and system information.
     """
-    print("\n" + "="*60)
-    print("                  🏦 WELCOME TO ATM 🏦")
-    print("                   Secure Banking System")
-    print("="*60)
-    print("📍 Location: Main Branch ATM")
-    print("🕒 Available 24/7")
-    print("🔒 Secure & Encrypted")
-    print("="*60)
+    sys.stdout.write(WELCOME_BANNER)
 
 
 def display_menu():
     """
     Display main ATM menu options.
     """
-    print("\n" + "="*50)
-    print("               🏧 ATM MAIN MENU 🏧")
-    print("="*50)
-    print("1. 💰 View Balance")
-    print("2. 💵 Deposit Money")
-    print("3. 💸 Withdraw Money")
-    print("4. 🔐 Change PIN")
-    print("5. 📄 Mini Statement (Last 5 Transactions)")
-    print("6. 🚪 Exit")
-    print("="*50)
+    sys.stdout.write(MENU_TEXT)
 
 
 def get_user_input(prompt, mask=False):
@@ -78,10 +113,14 @@ def display_error(message):
     """
     Display error message in a consistent format.
     
+    Suppressed (at the cost of one level check) when warnings are
+    disabled on the atm.validation logger.
+
     Args:
         message (str): Error message to display
     """
-    print(f"❌ {message}")
+    if _log.isEnabledFor(logging.WARNING):
+        print(f"❌ {message}")
 
 
 def display_success(message):
@@ -108,10 +147,13 @@ def display_warning(message):
     """
     Display warning message in a consistent format.
     
+    Suppressed when warnings are disabled on the atm.validation logger.
+
     Args:
         message (str): Warning message to display
     """
-    print(f"⚠️ {message}")
+    if _log.isEnabledFor(logging.WARNING):
+        print(f"⚠️ {message}")
 
 
 def confirm_action(message):
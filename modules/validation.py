@@ -1,208 +1,535 @@
-"""
-Validation Module
-Handles all input validation for the ATM system including account numbers,
-PINs, amounts, and menu choices.
-"""
-
-import re
-from modules.user_interface import display_error
-
-
-def validate_account_number(account_number):
-    """
-    Validate account number format and length.
-    
-    Args:
-        account_number (str): Account number to validate
-        
-    Returns:
-        bool: True if valid, False otherwise
-    """
-    if not account_number:
-        display_error("Account number cannot be empty.")
-        return False
-        
-    if not account_number.isdigit():
-        display_error("Account number must contain only digits.")
-        return False
-        
-    if len(account_number) < 6 or len(account_number) > 12:
-        display_error("Account number must be between 6 and 12 digits.")
-        return False
-        
-    return True
-
-
-def validate_pin(pin):
-    """
-    Validate PIN format - must be exactly 4 digits.
-    
-    Args:
-        pin (str): PIN to validate
-        
-    Returns:
-        bool: True if valid, False otherwise
-    """
-    if not pin:
-        display_error("PIN cannot be empty.")
-        return False
-        
-    if not pin.isdigit():
-        display_error("PIN must contain only digits.")
-        return False
-        
-    if len(pin) != 4:
-        display_error("PIN must be exactly 4 digits.")
-        return False
-        
-    return True
-
-
-def validate_amount(amount_str):
-    """
-    Validate monetary amount input.
-    
-    Args:
-        amount_str (str): Amount string to validate
-        
-    Returns:
-        bool: True if valid, False otherwise
-    """
-    if not amount_str:
-        display_error("Amount cannot be empty.")
-        return False
-        
-    # Remove common currency symbols and spaces
-    cleaned_amount = amount_str.replace('$', '').replace(',', '').strip()
-    
-    try:
-        amount = float(cleaned_amount)
-        
-        if amount < 0:
-            display_error("Amount cannot be negative.")
-            return False
-            
-        if amount == 0:
-            display_error("Amount must be greater than zero.")
-            return False
-            
-        # Check for reasonable maximum amount (prevent very large transactions)
-        if amount > 10000:
-            display_error("Amount cannot exceed $10,000 per transaction.")
-            return False
-            
-        # Check for too many decimal places
-        decimal_places = len(str(amount).split('.')[-1]) if '.' in str(amount) else 0
-        if decimal_places > 2:
-            display_error("Amount cannot have more than 2 decimal places.")
-            return False
-            
-        return True
-        
-    except ValueError:
-        display_error("Please enter a valid numeric amount.")
-        return False
-
-
-def validate_menu_choice(choice):
-    """
-    Validate menu choice input.
-    
-    Args:
-        choice (str): Menu choice to validate
-        
-    Returns:
-        bool: True if valid, False otherwise
-    """
-    if not choice:
-        display_error("Please select an option.")
-        return False
-        
-    if not choice.isdigit():
-        display_error("Please enter a valid number.")
-        return False
-        
-    choice_num = int(choice)
-    if choice_num < 1 or choice_num > 6:
-        display_error("Please select a number between 1 and 6.")
-        return False
-        
-    return True
-
-
-def validate_name(name):
-    """
-    Validate name input for account creation.
-    
-    Args:
-        name (str): Name to validate
-        
-    Returns:
-        bool: True if valid, False otherwise
-    """
-    if not name or not name.strip():
-        display_error("Name cannot be empty.")
-        return False
-        
-    if len(name.strip()) < 2:
-        display_error("Name must be at least 2 characters long.")
-        return False
-        
-    if len(name.strip()) > 50:
-        display_error("Name cannot exceed 50 characters.")
-        return False
-        
-    # Check for valid characters (letters, spaces, hyphens, apostrophes)
-    if not re.match(r"^[a-zA-Z\s\-']+$", name.strip()):
-        display_error("Name can only contain letters, spaces, hyphens, and apostrophes.")
-        return False
-        
-    return True
-
-
-def sanitize_input(user_input):
-    """
-    Sanitize user input by removing potentially harmful characters.
-    
-    Args:
-        user_input (str): Input to sanitize
-        
-    Returns:
-        str: Sanitized input
-    """
-    if not user_input:
-        return ""
-        
-    # Remove null bytes and control characters
-    sanitized = ''.join(char for char in user_input if ord(char) >= 32 or char in '\t\n')
-    
-    # Limit length to prevent buffer overflow attempts
-    return sanitized[:1000]
-
-
-def is_valid_transaction_amount(amount, current_balance, transaction_type="withdrawal"):
-    """
-    Validate transaction amount against account balance and limits.
-    
-    Args:
-        amount (float): Transaction amount
-        current_balance (float): Current account balance
-        transaction_type (str): Type of transaction ('withdrawal' or 'deposit')
-        
-    Returns:
-        tuple: (bool, str) - (is_valid, error_message)
-    """
-    if transaction_type == "withdrawal":
-        if amount > current_balance:
-            return False, f"Insufficient funds. Available balance: ${current_balance:,.2f}"
-            
-        # ATM daily withdrawal limit
-        if amount > 1000:
-            return False, "Daily withdrawal limit is $1,000."
-            
-    elif transaction_type == "deposit":
-        # ATM deposit limit
-        if amount > 5000:
-            return False, "Daily deposit limit is $5,000."
-    
-    return True, ""
\ No newline at end of file
+"""
+Validation Module
+Handles all input validation for the ATM system including account numbers,
+PINs, amounts, and menu choices.
+"""
+
+from collections import namedtuple
+from collections.abc import Iterable
+from types import SimpleNamespace
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+import re
+import string
+
+from modules.user_interface import display_error
+
+# Input limits gathered in one place; the regexes below and the
+# validators' default arguments are all derived from these, so a policy
+# change is a one-line edit
+_ACCT_MIN, _ACCT_MAX = 6, 12
+_PIN_LEN = 4
+_AMOUNT_MAX = 10_000
+_AMOUNT_MAX_DECIMALS = 2
+_AMOUNT_MAX_INPUT_LEN = 32
+_NAME_MIN, _NAME_MAX = 2, 50
+_SANITIZE_MAX = 1000
+
+# Compiled once at import so the pattern isn't re-parsed on every
+# keypress. \A...\Z anchors avoid $'s trailing-newline allowance, and
+# re.ASCII keeps the sre engine on its one-byte digit fast path, folding
+# the length and digits-only checks into a single C call.
+_PIN_RE = re.compile(rf'\A\d{{{_PIN_LEN}}}\Z', re.ASCII)
+_ACCT_RE = re.compile(rf'\A\d{{{_ACCT_MIN},{_ACCT_MAX}}}\Z', re.ASCII)
+# The ~55-character name alphabet is small enough that a frozenset
+# superset test beats the regex engine's setup and match-object
+# allocation outright; issuperset iterates the string entirely in C.
+# Whitespace mirrors the ASCII \s class the old pattern used.
+_NAME_ALLOWED = frozenset(string.ascii_letters + " \t\n\r\f\v-'")
+
+# Deletion table for sanitize_input: control characters except tab and
+# newline map to None. str.translate runs the whole pass in C instead of
+# a Python generator doing an ord() call per character.
+_DELETE_TABLE = dict.fromkeys(
+    i for i in range(32) if i not in (9, 10))
+_DELETE_TABLE[127] = None  # DEL
+
+# The menu accepts exactly six strings; one frozenset probe replaces the
+# isdigit/int/range-check sequence
+_VALID_MENU = frozenset("123456")
+
+# Per-transaction-type limits as dispatch tables, so adding a type means
+# adding an entry rather than another branch
+_LIMITS = {"withdrawal": 1000.0, "deposit": 5000.0}
+_LIMIT_MSG = {"withdrawal": "Daily withdrawal limit is $1,000.",
+              "deposit": "Daily deposit limit is $5,000."}
+
+# Characters a plausible amount can contain; sign characters stay so the
+# dedicated negative-amount message still fires after parsing
+_AMOUNT_CHARS = frozenset("0123456789.+-")
+
+# Layout bound once so each failure doesn't re-parse the format spec
+_MSG_INSUFFICIENT_FMT = "Insufficient funds. Available balance: ${:,.2f}".format
+
+# Lightweight carrier for a successfully parsed amount. A namedtuple has
+# no per-instance __dict__, and the cents field gives integer arithmetic
+# to callers that want exact comparisons without Decimal overhead.
+ValidatedAmount = namedtuple("ValidatedAmount", ["value", "cents"])
+
+
+@lru_cache(maxsize=8)
+def _insufficient_msg(balance: float) -> str:
+    """Format the insufficient-funds message, cached per balance.
+
+    A retry loop hammers this with the same balance every attempt; the
+    tiny cache turns the repeat formats into dict hits.
+    """
+    return _MSG_INSUFFICIENT_FMT(balance)
+
+# Error messages defined once; the check_* validators hand these back and
+# never print, so batch callers can validate thousands of inputs without
+# a TTY write per failure and can compare errors by identity
+_ERR_ACCT_EMPTY = "Account number cannot be empty."
+_ERR_ACCT_DIGITS = "Account number must contain only digits."
+_ERR_ACCT_LENGTH = "Account number must be between 6 and 12 digits."
+_ERR_PIN_EMPTY = "PIN cannot be empty."
+_ERR_PIN_LENGTH = "PIN must be exactly 4 digits."
+_ERR_AMOUNT_EMPTY = "Amount cannot be empty."
+_ERR_AMOUNT_INVALID = "Please enter a valid numeric amount."
+_ERR_AMOUNT_NEGATIVE = "Amount cannot be negative."
+_ERR_AMOUNT_ZERO = "Amount must be greater than zero."
+_ERR_AMOUNT_MAX = "Amount cannot exceed $10,000 per transaction."
+_ERR_AMOUNT_DECIMALS = "Amount cannot have more than 2 decimal places."
+_ERR_CHOICE_EMPTY = "Please select an option."
+_ERR_CHOICE_NUMERIC = "Please enter a valid number."
+_ERR_CHOICE_RANGE = "Please select a number between 1 and 6."
+_ERR_NAME_EMPTY = "Name cannot be empty."
+_ERR_NAME_SHORT = "Name must be at least 2 characters long."
+_ERR_NAME_LONG = "Name cannot exceed 50 characters."
+_ERR_NAME_CHARS = "Name can only contain letters, spaces, hyphens, and apostrophes."
+
+
+# The check_* validators are pure functions of their input string, so
+# repeated identical inputs (retry loops, demo scripts, tests) are served
+# from a small LRU cache instead of re-running the scans. The caches are
+# kept small enough to stay cache-resident, and clear_validation_caches()
+# exists because cached PIN strings should not outlive a session.
+@lru_cache(maxsize=256)
+def check_account_number(account_number: str) -> tuple[bool, str | None]:
+    """
+    Validate an account number without printing anything.
+
+    Args:
+        account_number (str): Account number to validate
+
+    Returns:
+        tuple: (bool, str or None) - validity flag and error message
+    """
+    if not account_number:
+        return False, _ERR_ACCT_EMPTY
+
+    # Accept with one compiled-pattern call; only rejected input pays
+    # for the extra scans that pick the more specific message
+    if _ACCT_RE.match(account_number):
+        return True, None
+
+    if not account_number.isdigit():
+        return False, _ERR_ACCT_DIGITS
+    return False, _ERR_ACCT_LENGTH
+
+
+def validate_account_number(account_number: str) -> bool:
+    """
+    Validate account number format and length.
+
+    Args:
+        account_number (str): Account number to validate
+
+    Returns:
+        bool: True if valid, False otherwise
+    """
+    ok, error = check_account_number(account_number)
+    if not ok:
+        display_error(error)
+    return ok
+
+
+@lru_cache(maxsize=256)
+def check_pin(pin: str) -> tuple[bool, str | None]:
+    """
+    Validate a PIN without printing anything.
+
+    Args:
+        pin (str): PIN to validate
+
+    Returns:
+        tuple: (bool, str or None) - validity flag and error message
+    """
+    if not pin:
+        return False, _ERR_PIN_EMPTY
+
+    # One compiled-pattern call covers length and digits-only together;
+    # "exactly 4 digits" is the right message either way
+    if _PIN_RE.match(pin) is None:
+        return False, _ERR_PIN_LENGTH
+    return True, None
+
+
+def validate_pin(pin: str) -> bool:
+    """
+    Validate PIN format - must be exactly 4 digits.
+
+    Args:
+        pin (str): PIN to validate
+
+    Returns:
+        bool: True if valid, False otherwise
+    """
+    ok, error = check_pin(pin)
+    if not ok:
+        display_error(error)
+    return ok
+
+
+@lru_cache(maxsize=256)
+def check_amount(amount_str: str, _max_len: int = _AMOUNT_MAX_INPUT_LEN,
+                 _max_decimals: int = _AMOUNT_MAX_DECIMALS,
+                 _max_amount: int = _AMOUNT_MAX
+                 ) -> tuple[bool, float | None, str | None]:
+    """
+    Validate a monetary amount string without printing anything.
+
+    Args:
+        amount_str (str): Amount string to validate
+
+    Returns:
+        tuple: (bool, float or None, str or None) - validity flag, the
+            parsed amount and error message
+    """
+    if not amount_str:
+        return False, None, _ERR_AMOUNT_EMPTY
+
+    # No legitimate amount comes close to the length cap; bail before
+    # doing any string surgery on garbage input
+    if len(amount_str) > _max_len:
+        return False, None, _ERR_AMOUNT_INVALID
+
+    # Remove common currency symbols and spaces. The `in` probes are
+    # single C scans and skip the replace allocations for plain input
+    # like "123.45"
+    cleaned_amount = amount_str
+    if '$' in cleaned_amount:
+        cleaned_amount = cleaned_amount.replace('$', '')
+    if ',' in cleaned_amount:
+        cleaned_amount = cleaned_amount.replace(',', '')
+    cleaned_amount = cleaned_amount.strip()
+
+    # Prescreen with a C-level superset test so obvious garbage never
+    # reaches the parser; raising and catching InvalidOperation costs
+    # roughly a microsecond, the frozenset probe nanoseconds
+    if (not cleaned_amount
+            or not _AMOUNT_CHARS.issuperset(cleaned_amount)
+            or cleaned_amount.count('.') > 1):
+        return False, None, _ERR_AMOUNT_INVALID
+
+    # The cleaned string already shows the entered decimal places (the
+    # prescreen bans exponent notation), so measure them with pure
+    # indexing before bothering to parse at all
+    if '.' in cleaned_amount:
+        frac_len = len(cleaned_amount) - cleaned_amount.rindex('.') - 1
+        if frac_len > _max_decimals:
+            return False, None, _ERR_AMOUNT_DECIMALS
+
+    # Parse with Decimal: exact fixed-point, and the decimal-place count
+    # comes straight from the exponent instead of a str(float) roundtrip
+    # that misjudges binary-rounded values
+    try:
+        amount = Decimal(cleaned_amount)
+    except InvalidOperation:
+        return False, None, _ERR_AMOUNT_INVALID
+
+    if not amount.is_finite():
+        return False, None, _ERR_AMOUNT_INVALID
+
+    if amount < 0:
+        return False, None, _ERR_AMOUNT_NEGATIVE
+
+    if amount == 0:
+        return False, None, _ERR_AMOUNT_ZERO
+
+    # Check for reasonable maximum amount (prevent very large transactions)
+    if amount > _max_amount:
+        return False, None, _ERR_AMOUNT_MAX
+
+    # Balances are floats throughout the system, so hand back a float;
+    # the Decimal was only needed for exact validation
+    return True, float(amount), None
+
+
+def validate_amount(amount_str: str) -> tuple[bool, float | None]:
+    """
+    Validate monetary amount input.
+
+    Args:
+        amount_str (str): Amount string to validate
+
+    Returns:
+        tuple: (bool, float or None) - validity flag and the parsed amount,
+            so callers don't have to re-parse the string
+    """
+    ok, amount, error = check_amount(amount_str)
+    if not ok:
+        display_error(error)
+    return ok, amount
+
+
+def parse_amount(amount_str: str) -> ValidatedAmount | None:
+    """
+    Parse and validate an amount into a ValidatedAmount, silently.
+
+    The carrier flows the already-parsed value downstream so nothing
+    re-runs float() on the string, and the cents integer supports exact
+    arithmetic in hot paths. Callers test truthiness: None means invalid.
+
+    Args:
+        amount_str (str): Amount string to validate
+
+    Returns:
+        ValidatedAmount or None: Parsed (value, cents) on success
+    """
+    ok, value, _ = check_amount(amount_str)
+    if not ok:
+        return None
+    # check_amount caps amounts at 2 decimal places, so round() recovers
+    # the exact cent count from the binary float
+    return ValidatedAmount(value, round(value * 100))
+
+
+def check_menu_choice(choice: str) -> tuple[bool, str | None]:
+    """
+    Validate a menu choice without printing anything.
+
+    Args:
+        choice (str): Menu choice to validate
+
+    Returns:
+        tuple: (bool, str or None) - validity flag and error message
+    """
+    if not choice:
+        return False, _ERR_CHOICE_EMPTY
+
+    if choice in _VALID_MENU:
+        return True, None
+
+    # Only fall back to isdigit to pick the right error message
+    if not choice.isdigit():
+        return False, _ERR_CHOICE_NUMERIC
+    return False, _ERR_CHOICE_RANGE
+
+
+def validate_menu_choice(choice: str) -> bool:
+    """
+    Validate menu choice input.
+
+    Args:
+        choice (str): Menu choice to validate
+
+    Returns:
+        bool: True if valid, False otherwise
+    """
+    ok, error = check_menu_choice(choice)
+    if not ok:
+        display_error(error)
+    return ok
+
+
+def check_name(name: str, _min: int = _NAME_MIN,
+               _max: int = _NAME_MAX) -> tuple[bool, str | None]:
+    """
+    Validate a name without printing anything.
+
+    Args:
+        name (str): Name to validate
+
+    Returns:
+        tuple: (bool, str or None) - validity flag and error message
+    """
+    # Strip once; each .strip() call allocates a fresh string
+    stripped = name.strip() if name else ""
+    if not stripped:
+        return False, _ERR_NAME_EMPTY
+
+    n = len(stripped)
+    if n < _min:
+        return False, _ERR_NAME_SHORT
+
+    if n > _max:
+        return False, _ERR_NAME_LONG
+
+    # Check for valid characters (letters, spaces, hyphens, apostrophes)
+    if not _NAME_ALLOWED.issuperset(stripped):
+        return False, _ERR_NAME_CHARS
+
+    return True, None
+
+
+def validate_name(name: str) -> bool:
+    """
+    Validate name input for account creation.
+
+    Args:
+        name (str): Name to validate
+
+    Returns:
+        bool: True if valid, False otherwise
+    """
+    ok, error = check_name(name)
+    if not ok:
+        display_error(error)
+    return ok
+
+
+def check_pins_bulk(pins: Iterable[str | None]) -> list[bool]:
+    """
+    Validate many PINs in one pass for batch import paths.
+
+    A single comprehension with the compiled pattern's bound match method
+    keeps the per-PIN cost to one C call — no wrapper frames, caching or
+    error-message work per element.
+
+    Args:
+        pins (iterable): PIN strings to validate
+
+    Returns:
+        list: Boolean validity flag per PIN, in input order
+    """
+    match = _PIN_RE.match
+    return [pin is not None and match(pin) is not None for pin in pins]
+
+
+def check_account_numbers_bulk(
+        account_numbers: Iterable[str | None]) -> list[bool]:
+    """
+    Validate many account numbers in one pass for batch import paths.
+
+    Args:
+        account_numbers (iterable): Account number strings to validate
+
+    Returns:
+        list: Boolean validity flag per account number, in input order
+    """
+    match = _ACCT_RE.match
+    return [num is not None and match(num) is not None
+            for num in account_numbers]
+
+
+def make_validators(display_error=display_error,
+                    _pin_match=_PIN_RE.match,
+                    _acct_match=_ACCT_RE.match,
+                    _valid_menu=_VALID_MENU,
+                    _check_amount=check_amount,
+                    _err_pin_empty=_ERR_PIN_EMPTY,
+                    _err_pin_length=_ERR_PIN_LENGTH,
+                    _err_acct_empty=_ERR_ACCT_EMPTY,
+                    _err_acct_length=_ERR_ACCT_LENGTH,
+                    _err_acct_digits=_ERR_ACCT_DIGITS,
+                    _err_choice_empty=_ERR_CHOICE_EMPTY,
+                    _err_choice_numeric=_ERR_CHOICE_NUMERIC,
+                    _err_choice_range=_ERR_CHOICE_RANGE) -> SimpleNamespace:
+    """
+    Build a bundle of validator closures for a tight input loop.
+
+    Everything a validator touches is captured as a default argument, so
+    inside the closures each reference is a LOAD_FAST local instead of a
+    module-global dict lookup — worthwhile when validation runs on every
+    keystroke. The closures keep the same behavior as the module-level
+    validate_* functions, minus the lru_cache layer the loop doesn't need.
+
+    Returns:
+        SimpleNamespace: pin, account_number, menu_choice and amount
+            validators with the module-level signatures
+    """
+    def validate_pin(pin: str) -> bool:
+        if not pin:
+            display_error(_err_pin_empty)
+            return False
+        if _pin_match(pin) is None:
+            display_error(_err_pin_length)
+            return False
+        return True
+
+    def validate_account_number(account_number: str) -> bool:
+        if not account_number:
+            display_error(_err_acct_empty)
+            return False
+        if _acct_match(account_number) is None:
+            display_error(_err_acct_digits
+                          if not account_number.isdigit()
+                          else _err_acct_length)
+            return False
+        return True
+
+    def validate_menu_choice(choice: str) -> bool:
+        if not choice:
+            display_error(_err_choice_empty)
+            return False
+        if choice not in _valid_menu:
+            display_error(_err_choice_range if choice.isdigit()
+                          else _err_choice_numeric)
+            return False
+        return True
+
+    def validate_amount(amount_str: str) -> tuple[bool, float | None]:
+        ok, amount, error = _check_amount(amount_str)
+        if not ok:
+            display_error(error)
+        return ok, amount
+
+    return SimpleNamespace(validate_pin=validate_pin,
+                           validate_account_number=validate_account_number,
+                           validate_menu_choice=validate_menu_choice,
+                           validate_amount=validate_amount)
+
+
+def clear_validation_caches() -> None:
+    """
+    Drop the memoized validation results.
+
+    Entered PINs live on as cache keys, so call this when a session ends
+    to avoid keeping them in memory longer than necessary.
+    """
+    check_account_number.cache_clear()
+    check_pin.cache_clear()
+    check_amount.cache_clear()
+
+
+def sanitize_input(user_input: str, _max: int = _SANITIZE_MAX) -> str:
+    """
+    Sanitize user input by removing potentially harmful characters.
+
+    Args:
+        user_input (str): Input to sanitize
+
+    Returns:
+        str: Sanitized input
+    """
+    if not user_input:
+        return ""
+
+    # Bound the work first, then strip null bytes and control characters
+    # with the precomputed C-level translation table
+    return user_input[:_max].translate(_DELETE_TABLE)
+
+
+def is_valid_transaction_amount(amount: float, current_balance: float,
+                                transaction_type: str = "withdrawal"
+                                ) -> tuple[bool, str]:
+    """
+    Validate transaction amount against account balance and limits.
+
+    Args:
+        amount (float): Transaction amount
+        current_balance (float): Current account balance
+        transaction_type (str): Type of transaction ('withdrawal' or 'deposit')
+
+    Returns:
+        tuple: (bool, str) - (is_valid, error_message)
+    """
+    if transaction_type == "withdrawal" and amount > current_balance:
+        return False, _insufficient_msg(current_balance)
+
+    limit = _LIMITS.get(transaction_type)
+    if limit is not None and amount > limit:
+        return False, _LIMIT_MSG[transaction_type]
+
+    return True, ""